@@ -8,11 +8,34 @@ Includes cycle detection, validation, and helper functions for dependency manage
 
 import heapq
 from collections import deque
-from typing import TypedDict
+from functools import lru_cache
+from typing import Iterator, TypedDict
 
 # Security: Prevent DoS via excessive dependencies
 MAX_DEPENDENCIES_PER_FEATURE = 20
-MAX_DEPENDENCY_DEPTH = 50  # Prevent stack overflow in cycle detection
+
+
+class FeatureIndex:
+    """Precomputed lookups over a feature list.
+
+    The status helpers each need passing IDs and dependency lists; building
+    the index once per call avoids re-scanning the features per lookup.
+    """
+
+    def __init__(self, features: list[dict]) -> None:
+        self.features = features
+        self.by_id: dict[int, dict] = {}
+        self.deps_by_id: dict[int, list[int]] = {}
+        self.passing_ids: set[int] = set()
+        self.in_progress_ids: set[int] = set()
+        for f in features:
+            fid = f["id"]
+            self.by_id[fid] = f
+            self.deps_by_id[fid] = f.get("dependencies") or []
+            if f.get("passes"):
+                self.passing_ids.add(fid)
+            if f.get("in_progress"):
+                self.in_progress_ids.add(fid)
 
 
 class DependencyResult(TypedDict):
@@ -25,7 +48,7 @@ class DependencyResult(TypedDict):
 
 
 def resolve_dependencies(features: list[dict]) -> DependencyResult:
-    """Topological sort using Kahn's algorithm with priority-aware ordering.
+    """Topological sort using Kahn's algorithm with a priority-sorted seed.
 
     Returns ordered features respecting dependencies, plus metadata about
     cycles, blocked features, and missing dependencies.
@@ -37,53 +60,71 @@ def resolve_dependencies(features: list[dict]) -> DependencyResult:
         DependencyResult with ordered_features, circular_dependencies,
         blocked_features, and missing_dependencies
     """
+    # Fast path: greenfield projects often have no dependencies at all, so
+    # skip graph construction and Kahn's entirely
+    if not any(f.get("dependencies") for f in features):
+        return {
+            "ordered_features": sorted(
+                features, key=lambda f: (f.get("priority", 999), f["id"])
+            ),
+            "circular_dependencies": [],
+            "blocked_features": {},
+            "missing_dependencies": {},
+        }
+
     feature_map = {f["id"]: f for f in features}
     in_degree = {f["id"]: 0 for f in features}
     adjacency: dict[int, list[int]] = {f["id"]: [] for f in features}
     blocked: dict[int, list[int]] = {}
     missing: dict[int, list[int]] = {}
 
-    # Build graph
+    # Build graph. Dedupe dependencies so a repeated dep_id can't inflate
+    # in_degree/adjacency and corrupt Kahn's loop.
+    blocked_setdefault = blocked.setdefault
+    missing_setdefault = missing.setdefault
     for feature in features:
-        deps = feature.get("dependencies") or []
-        for dep_id in deps:
-            if dep_id not in feature_map:
-                missing.setdefault(feature["id"], []).append(dep_id)
+        fid = feature["id"]
+        seen: set[int] = set()
+        for dep_id in feature.get("dependencies") or ():
+            if dep_id in seen:
+                continue
+            seen.add(dep_id)
+            dep = feature_map.get(dep_id)
+            if dep is None:
+                missing_setdefault(fid, []).append(dep_id)
             else:
-                adjacency[dep_id].append(feature["id"])
-                in_degree[feature["id"]] += 1
+                adjacency[dep_id].append(fid)
+                in_degree[fid] += 1
                 # Track blocked features
-                dep = feature_map[dep_id]
                 if not dep.get("passes"):
-                    blocked.setdefault(feature["id"], []).append(dep_id)
-
-    # Kahn's algorithm with priority-aware selection using a heap
-    # Heap entries are tuples: (priority, id, feature_dict) for stable ordering
-    heap = [
-        (f.get("priority", 999), f["id"], f)
-        for f in features
-        if in_degree[f["id"]] == 0
-    ]
-    heapq.heapify(heap)
+                    blocked_setdefault(fid, []).append(dep_id)
+
+    # Kahn's algorithm with a plain FIFO deque. The zero-in-degree seed is
+    # sorted once by (priority, id) so co-ready roots come out in priority
+    # order without paying O(log V) heap ops per push/pop.
+    ready: deque[dict] = deque(
+        sorted(
+            (f for f in features if in_degree[f["id"]] == 0),
+            key=lambda f: (f.get("priority", 999), f["id"]),
+        )
+    )
     ordered: list[dict] = []
+    ordered_ids: set[int] = set()
 
-    while heap:
-        _, _, current = heapq.heappop(heap)
+    while ready:
+        current = ready.popleft()
         ordered.append(current)
+        ordered_ids.add(current["id"])
         for dependent_id in adjacency[current["id"]]:
             in_degree[dependent_id] -= 1
             if in_degree[dependent_id] == 0:
-                dep_feature = feature_map[dependent_id]
-                heapq.heappush(
-                    heap,
-                    (dep_feature.get("priority", 999), dependent_id, dep_feature)
-                )
+                ready.append(feature_map[dependent_id])
 
     # Detect cycles (features not in ordered = part of cycle)
     cycles: list[list[int]] = []
     if len(ordered) < len(features):
-        remaining = [f for f in features if f not in ordered]
-        cycles = _detect_cycles(remaining, feature_map)
+        remaining = [f for f in features if f["id"] not in ordered_ids]
+        cycles = _detect_cycles(remaining, feature_map, in_degree)
         ordered.extend(remaining)  # Add cyclic features at end
 
     return {
@@ -142,17 +183,39 @@ def get_blocking_dependencies(
     return [dep_id for dep_id in deps if dep_id not in passing_ids]
 
 
+def build_dep_index(features: list[dict]) -> dict[int, tuple[int, ...]]:
+    """Build a lightweight id -> dependency-tuple map.
+
+    Cheaper to construct and hold than a full feature map when only the
+    dependency edges are needed, e.g. for repeated cycle checks while a
+    user edits dependencies in the UI.
+
+    Args:
+        features: List of all feature dicts
+
+    Returns:
+        Dict mapping feature_id -> tuple of dependency IDs
+    """
+    return {f["id"]: tuple(f.get("dependencies") or ()) for f in features}
+
+
 def would_create_circular_dependency(
-    features: list[dict], source_id: int, target_id: int
+    features: list[dict],
+    source_id: int,
+    target_id: int,
+    dep_index: dict[int, tuple[int, ...]] | None = None,
 ) -> bool:
     """Check if adding a dependency from target to source would create a cycle.
 
-    Uses DFS with visited set for efficient cycle detection.
+    Uses iterative DFS with a visited set, so arbitrarily deep dependency
+    chains cannot overflow the Python call stack.
 
     Args:
         features: List of all feature dicts
         source_id: The feature that would gain the dependency
         target_id: The feature that would become a dependency
+        dep_index: Optional pre-built map from build_dep_index. Pass one
+            when checking several candidate edges on the same feature list.
 
     Returns:
         True if adding the dependency would create a cycle
@@ -160,40 +223,26 @@ def would_create_circular_dependency(
     if source_id == target_id:
         return True  # Self-reference is a cycle
 
-    feature_map = {f["id"]: f for f in features}
-    source = feature_map.get(source_id)
-    if not source:
-        return False
-
-    # Check if target already depends on source (direct or indirect)
-    target = feature_map.get(target_id)
-    if not target:
+    if dep_index is None:
+        dep_index = build_dep_index(features)
+    if source_id not in dep_index or target_id not in dep_index:
         return False
 
-    # DFS from target to see if we can reach source
-    visited: set[int] = set()
+    # DFS from target to see if we can reach source; the visited set
+    # bounds the walk to O(V+E) even with existing cycles in the graph
+    stack = [target_id]
+    visited: set[int] = {target_id}
 
-    def can_reach(current_id: int, depth: int = 0) -> bool:
-        # Security: Prevent stack overflow with depth limit
-        if depth > MAX_DEPENDENCY_DEPTH:
-            return True  # Assume cycle if too deep (fail-safe)
+    while stack:
+        current_id = stack.pop()
         if current_id == source_id:
             return True
-        if current_id in visited:
-            return False
-        visited.add(current_id)
-
-        current = feature_map.get(current_id)
-        if not current:
-            return False
+        for dep_id in dep_index.get(current_id, ()):
+            if dep_id not in visited:
+                visited.add(dep_id)
+                stack.append(dep_id)
 
-        deps = current.get("dependencies") or []
-        for dep_id in deps:
-            if can_reach(dep_id, depth + 1):
-                return True
-        return False
-
-    return can_reach(target_id)
+    return False
 
 
 def validate_dependencies(
@@ -217,9 +266,10 @@ def validate_dependencies(
     if feature_id in dependency_ids:
         return False, "A feature cannot depend on itself"
 
-    # Check all dependencies exist
-    missing = [d for d in dependency_ids if d not in all_feature_ids]
-    if missing:
+    # Check all dependencies exist (boolean probe first: the valid path
+    # short-circuits without building a list)
+    if any(d not in all_feature_ids for d in dependency_ids):
+        missing = [d for d in dependency_ids if d not in all_feature_ids]
         return False, f"Dependencies not found: {missing}"
 
     # Check for duplicates
@@ -229,44 +279,78 @@ def validate_dependencies(
     return True, ""
 
 
-def _detect_cycles(features: list[dict], feature_map: dict) -> list[list[int]]:
-    """Detect cycles using DFS with recursion tracking.
+def _detect_cycles(
+    features: list[dict], feature_map: dict, in_degree: dict[int, int] | None = None
+) -> list[list[int]]:
+    """Detect cycles using iterative DFS with white/gray/black coloring.
+
+    Gray nodes are on the current DFS path; hitting a gray neighbor means a
+    cycle, reconstructed by walking parent pointers back to the neighbor.
 
     Args:
         features: List of features to check for cycles
         feature_map: Map of feature_id -> feature dict
+        in_degree: Optional residual in-degrees from Kahn's loop. Nodes that
+            drained to 0 are already proven acyclic, so traversal is pruned
+            to the in_degree > 0 core.
 
     Returns:
         List of cycles, where each cycle is a list of feature IDs
     """
+    WHITE, GRAY, BLACK = 0, 1, 2
     cycles: list[list[int]] = []
-    visited: set[int] = set()
-    rec_stack: set[int] = set()
-    path: list[int] = []
-
-    def dfs(fid: int) -> bool:
-        visited.add(fid)
-        rec_stack.add(fid)
-        path.append(fid)
+    color: dict[int, int] = {}
+    parent: dict[int, int] = {}
+    candidates: set[int] | None = None
+    if in_degree is not None:
+        candidates = {fid for fid, d in in_degree.items() if d > 0}
 
+    def _deps_iter(fid: int) -> Iterator[int]:
         feature = feature_map.get(fid)
-        if feature:
-            for dep_id in feature.get("dependencies") or []:
-                if dep_id not in visited:
-                    if dfs(dep_id):
-                        return True
-                elif dep_id in rec_stack:
-                    cycle_start = path.index(dep_id)
-                    cycles.append(path[cycle_start:])
-                    return True
-
-        path.pop()
-        rec_stack.remove(fid)
-        return False
+        if not feature:
+            return iter(())
+        deps = feature.get("dependencies") or ()
+        if candidates is None:
+            return iter(deps)
+        return (d for d in deps if d in candidates)
 
     for f in features:
-        if f["id"] not in visited:
-            dfs(f["id"])
+        start = f["id"]
+        if color.get(start, WHITE) != WHITE:
+            continue
+
+        color[start] = GRAY
+        stack: list[tuple[int, Iterator[int]]] = [(start, _deps_iter(start))]
+        found = False
+
+        while stack and not found:
+            fid, deps = stack[-1]
+            for dep_id in deps:
+                dep_color = color.get(dep_id, WHITE)
+                if dep_color == WHITE:
+                    color[dep_id] = GRAY
+                    parent[dep_id] = fid
+                    stack.append((dep_id, _deps_iter(dep_id)))
+                    break
+                elif dep_color == GRAY:
+                    # Walk parent chain from fid back to dep_id: O(cycle_len)
+                    cycle = [fid]
+                    node = fid
+                    while node != dep_id:
+                        node = parent[node]
+                        cycle.append(node)
+                    cycle.reverse()
+                    cycles.append(cycle)
+                    found = True
+                    break
+            else:
+                color[fid] = BLACK
+                stack.pop()
+
+        if found:
+            # Finish the aborted path so later roots don't see stale grays
+            for fid, _ in stack:
+                color[fid] = BLACK
 
     return cycles
 
@@ -281,6 +365,12 @@ def compute_scheduling_scores(features: list[dict]) -> dict[int, float]:
 
     Score formula: (1000 * unblock) + (100 * depth_score) + (10 * priority_factor)
 
+    Results are memoized on the graph content (id, priority, dependencies),
+    so repeated calls with an unchanged graph skip the BFS/downstream passes.
+    The memo key sorts the entries, which is sound because the computation
+    is a pure function of the graph content — the order the caller lists
+    the features never affects the scores.
+
     Args:
         features: List of feature dicts with id, priority, dependencies fields
 
@@ -290,64 +380,101 @@ def compute_scheduling_scores(features: list[dict]) -> dict[int, float]:
     if not features:
         return {}
 
-    # Build adjacency lists
-    children: dict[int, list[int]] = {f["id"]: [] for f in features}  # who depends on me
-    parents: dict[int, list[int]] = {f["id"]: [] for f in features}   # who I depend on
+    key = tuple(
+        sorted(
+            (f["id"], f.get("priority", 999), tuple(f.get("dependencies") or ()))
+            for f in features
+        )
+    )
+    # Copy so callers can't mutate the cached dict
+    return dict(_scores_cached(key))
 
-    for f in features:
-        for dep_id in (f.get("dependencies") or []):
-            if dep_id in children:  # Only valid deps
-                children[dep_id].append(f["id"])
-                parents[f["id"]].append(dep_id)
-
-    # Calculate depths via BFS from roots
-    # Use visited set to prevent infinite loops from circular dependencies
-    # Use deque for O(1) popleft instead of list.pop(0) which is O(n)
-    depths: dict[int, int] = {}
-    visited: set[int] = set()
-    roots = [f["id"] for f in features if not parents[f["id"]]]
-    bfs_queue: deque[tuple[int, int]] = deque((root, 0) for root in roots)
-    while bfs_queue:
-        node_id, depth = bfs_queue.popleft()
-        if node_id in visited:
-            continue  # Skip already visited nodes (handles cycles)
-        visited.add(node_id)
-        depths[node_id] = depth
-        for child_id in children[node_id]:
-            if child_id not in visited:
-                bfs_queue.append((child_id, depth + 1))
-
-    # Handle orphaned nodes (shouldn't happen but be safe)
-    for f in features:
-        if f["id"] not in depths:
-            depths[f["id"]] = 0
 
-    # Calculate transitive downstream counts (reverse topo order)
-    downstream: dict[int, int] = {f["id"]: 0 for f in features}
-    # Process in reverse depth order (leaves first)
-    for fid in sorted(depths.keys(), key=lambda x: -depths[x]):
-        for parent_id in parents[fid]:
-            downstream[parent_id] += 1 + downstream[fid]
+@lru_cache(maxsize=32)
+def _scores_cached(key: tuple) -> dict[int, float]:
+    """Cached score computation keyed on (id, priority, dependencies) tuples.
 
-    # Normalize and compute scores
-    max_depth = max(depths.values()) if depths else 0
-    max_downstream = max(downstream.values()) if downstream else 0
+    Features are indexed by position so the graph lives in parallel lists
+    instead of dict-of-list adjacency.
+    """
+    n = len(key)
+    ids = [entry[0] for entry in key]
+    priorities = [entry[1] for entry in key]
+    id_to_idx = {fid: i for i, fid in enumerate(ids)}
+
+    # Parallel adjacency lists indexed by position:
+    # children[i] = who depends on i, parents[i] = who i depends on
+    children: list[list[int]] = [[] for _ in range(n)]
+    parents: list[list[int]] = [[] for _ in range(n)]
+    for i, (_, _, deps) in enumerate(key):
+        for dep_id in deps:
+            dep_idx = id_to_idx.get(dep_id)
+            if dep_idx is not None:  # Only valid deps
+                children[dep_idx].append(i)
+                parents[i].append(dep_idx)
+
+    # Calculate depths via BFS from roots. The visited flags prevent
+    # infinite loops from circular dependencies.
+    depths = [0] * n
+    visited = [False] * n
+    bfs_queue: deque[tuple[int, int]] = deque(
+        (i, 0) for i in range(n) if not parents[i]
+    )
+    while bfs_queue:
+        idx, depth = bfs_queue.popleft()
+        if visited[idx]:
+            continue  # Skip already visited nodes (handles cycles)
+        visited[idx] = True
+        depths[idx] = depth
+        for child_idx in children[idx]:
+            if not visited[child_idx]:
+                bfs_queue.append((child_idx, depth + 1))
+
+    # Transitive downstream counts in reverse-topological order (Kahn's
+    # from the leaves): a node's count is final before it flows into any
+    # parent, so downstream[i] = sum(1 + downstream[c] for c in children[i])
+    # holds exactly and the result depends only on the graph content, never
+    # on iteration order.
+    downstream = [0] * n
+    pending_children = [len(children[i]) for i in range(n)]
+    topo_queue: deque[int] = deque(i for i in range(n) if not pending_children[i])
+    processed = [False] * n
+    while topo_queue:
+        idx = topo_queue.popleft()
+        processed[idx] = True
+        for parent_idx in parents[idx]:
+            downstream[parent_idx] += 1 + downstream[idx]
+            pending_children[parent_idx] -= 1
+            if pending_children[parent_idx] == 0:
+                topo_queue.append(parent_idx)
+    # Nodes on or behind a cycle never drain out of Kahn's queue. Cycles
+    # are rejected at dependency-add time, so this is defensive: fall back
+    # to decreasing-depth order for the stragglers to keep scores defined.
+    if not all(processed):
+        stragglers = sorted(
+            (i for i in range(n) if not processed[i]), key=lambda i: -depths[i]
+        )
+        for idx in stragglers:
+            for parent_idx in parents[idx]:
+                downstream[parent_idx] += 1 + downstream[idx]
+
+    # Normalize and compute scores. Hoist the normalization reciprocals out
+    # of the loop so each row is just multiply-adds:
+    #   unblock: 0-1, higher = unblocks more
+    #   depth_score: 0-1, higher = closer to root (no deps)
+    #   priority_factor: 0-1, lower priority number = higher factor
+    max_depth = max(depths) if depths else 0
+    max_downstream = max(downstream) if downstream else 0
+    unblock_scale = 1000.0 / max_downstream if max_downstream > 0 else 0.0
+    depth_scale = 100.0 / max_depth if max_depth > 0 else 0.0
 
     scores: dict[int, float] = {}
-    for f in features:
-        fid = f["id"]
-
-        # Unblocking score: 0-1, higher = unblocks more
-        unblock = downstream[fid] / max_downstream if max_downstream > 0 else 0
-
-        # Depth score: 0-1, higher = closer to root (no deps)
-        depth_score = 1 - (depths[fid] / max_depth) if max_depth > 0 else 1
-
-        # Priority factor: 0-1, lower priority number = higher factor
-        priority = f.get("priority", 999)
-        priority_factor = (10 - min(priority, 10)) / 10
-
-        scores[fid] = (1000 * unblock) + (100 * depth_score) + (10 * priority_factor)
+    for i in range(n):
+        scores[ids[i]] = (
+            (unblock_scale * downstream[i])
+            + (100.0 - depth_scale * depths[i])
+            + (10.0 - min(priorities[i], 10))
+        )
 
     return scores
 
@@ -367,21 +494,61 @@ def get_ready_features(features: list[dict], limit: int = 10) -> list[dict]:
     Returns:
         List of ready features, sorted by priority
     """
-    passing_ids = {f["id"] for f in features if f.get("passes")}
+    index = FeatureIndex(features)
+    passing_ids = index.passing_ids
 
     ready = []
     for f in features:
-        if f.get("passes") or f.get("in_progress"):
+        fid = f["id"]
+        if fid in passing_ids or fid in index.in_progress_ids:
             continue
-        deps = f.get("dependencies") or []
-        if all(dep_id in passing_ids for dep_id in deps):
+        if all(dep_id in passing_ids for dep_id in index.deps_by_id[fid]):
             ready.append(f)
 
-    # Sort by scheduling score (higher = first), then priority, then id
+    # Top-`limit` by scheduling score (higher = first), then priority, then
+    # id; nsmallest is O(n log limit) vs sorting the whole ready list
     scores = compute_scheduling_scores(features)
-    ready.sort(key=lambda f: (-scores.get(f["id"], 0), f.get("priority", 999), f["id"]))
+    return heapq.nsmallest(
+        limit,
+        ready,
+        key=lambda f: (-scores.get(f["id"], 0), f.get("priority", 999), f["id"]),
+    )
+
+
+def has_blocking_dependencies(feature: dict, passing_ids: set[int]) -> bool:
+    """Check if any dependency is not yet passing.
+
+    Short-circuits on the first blocker and allocates nothing, unlike
+    get_blocking_dependencies which materializes the full list.
 
-    return ready[:limit]
+    Args:
+        feature: Feature dict to check
+        passing_ids: Pre-computed set of passing feature IDs
+
+    Returns:
+        True if at least one dependency is incomplete
+    """
+    return any(d not in passing_ids for d in feature.get("dependencies") or ())
+
+
+def _classify(feature: dict, index: FeatureIndex) -> tuple[str, list[int]]:
+    """Classify one feature as done/blocked/in_progress/pending.
+
+    Returns:
+        Tuple of (status, blocking dependency IDs)
+    """
+    if feature.get("passes"):
+        return "done", []
+    # Boolean probe first: the common unblocked path scans without
+    # allocating; only actual blockers materialize the list
+    if has_blocking_dependencies(feature, index.passing_ids):
+        blocking = [
+            d for d in index.deps_by_id[feature["id"]] if d not in index.passing_ids
+        ]
+        return "blocked", blocking
+    if feature.get("in_progress"):
+        return "in_progress", []
+    return "pending", []
 
 
 def get_blocked_features(features: list[dict]) -> list[dict]:
@@ -393,15 +560,12 @@ def get_blocked_features(features: list[dict]) -> list[dict]:
     Returns:
         List of blocked features with 'blocked_by' field added
     """
-    passing_ids = {f["id"] for f in features if f.get("passes")}
+    index = FeatureIndex(features)
 
     blocked = []
     for f in features:
-        if f.get("passes"):
-            continue
-        deps = f.get("dependencies") or []
-        blocking = [d for d in deps if d not in passing_ids]
-        if blocking:
+        status, blocking = _classify(f, index)
+        if status == "blocked":
             blocked.append({**f, "blocked_by": blocking})
 
     return blocked
@@ -416,23 +580,14 @@ def build_graph_data(features: list[dict]) -> dict:
     Returns:
         Dict with 'nodes' and 'edges' for graph visualization
     """
-    passing_ids = {f["id"] for f in features if f.get("passes")}
+    index = FeatureIndex(features)
 
     nodes = []
     edges = []
 
     for f in features:
-        deps = f.get("dependencies") or []
-        blocking = [d for d in deps if d not in passing_ids]
-
-        if f.get("passes"):
-            status = "done"
-        elif blocking:
-            status = "blocked"
-        elif f.get("in_progress"):
-            status = "in_progress"
-        else:
-            status = "pending"
+        deps = index.deps_by_id[f["id"]]
+        status, _ = _classify(f, index)
 
         nodes.append({
             "id": f["id"],
@@ -41,6 +41,7 @@ assistant.db-shm
 .devserver.lock
 .claude_settings.json
 .claude_assistant_settings.json
+.claude_settings.expand.json
 .claude_settings.expand.*.json
 .progress_cache
 """
@@ -159,12 +160,13 @@ def get_prompts_dir(project_dir: Path) -> Path:
 # Non-dual-path helpers (always use new location)
 # ---------------------------------------------------------------------------
 
-def get_expand_settings_path(project_dir: Path, uuid_hex: str) -> Path:
-    """Return the path for an ephemeral expand-session settings file.
+def get_expand_settings_path(project_dir: Path) -> Path:
+    """Return the path for the shared expand-session settings file.
 
-    These files are short-lived and always stored in ``.autoforge/``.
+    The content is identical for every session, so one file per project
+    is written once and reused. Always stored in ``.autoforge/``.
     """
-    return project_dir / ".autoforge" / f".claude_settings.expand.{uuid_hex}.json"
+    return project_dir / ".autoforge" / ".claude_settings.expand.json"
 
 
 # ---------------------------------------------------------------------------
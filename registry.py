@@ -13,10 +13,12 @@ import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy import Column, DateTime, Integer, String, create_engine, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 # Module logger
@@ -600,6 +602,35 @@ def set_setting(key: str, value: str) -> None:
     logger.debug("Set setting '%s' = '%s'", key, value)
 
 
+def set_settings(mapping: dict[str, str]) -> None:
+    """
+    Set multiple settings in a single transaction.
+
+    Uses one SQLite upsert statement for all keys, so the whole batch costs
+    a single round-trip and fsync instead of a SELECT plus per-row writes.
+
+    Args:
+        mapping: Dictionary of setting keys to values.
+    """
+    if not mapping:
+        return
+
+    now = datetime.now()
+    stmt = sqlite_insert(Settings).values([
+        {"key": key, "value": value, "updated_at": now}
+        for key, value in mapping.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Settings.key],
+        set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+    )
+
+    with _get_session() as session:
+        session.execute(stmt)
+
+    logger.debug("Set settings: %s", ", ".join(sorted(mapping)))
+
+
 def get_all_settings() -> dict[str, str]:
     """
     Get all settings as a dictionary.
@@ -697,6 +728,20 @@ API_PROVIDERS: dict[str, dict[str, Any]] = {
 }
 
 
+@lru_cache(maxsize=1)
+def _forwarded_api_env() -> tuple[tuple[str, str], ...]:
+    """Snapshot the API env vars forwarded to the SDK for the claude provider.
+
+    The .env is loaded at startup and these vars don't change while the
+    process runs, so the per-var getenv scan happens once. Tests can reset
+    with _forwarded_api_env.cache_clear().
+    """
+    from env_constants import API_ENV_VARS
+    return tuple(
+        (var, value) for var in API_ENV_VARS if (value := os.getenv(var))
+    )
+
+
 def get_effective_sdk_env() -> dict[str, str]:
     """Build environment variable dict for Claude SDK based on current API provider settings.
 
@@ -711,25 +756,13 @@ def get_effective_sdk_env() -> dict[str, str]:
 
     if provider_id == "claude":
         # Default behavior: forward existing env vars
-        from env_constants import API_ENV_VARS
-        sdk_env: dict[str, str] = {}
-        for var in API_ENV_VARS:
-            value = os.getenv(var)
-            if value:
-                sdk_env[var] = value
-        return sdk_env
+        return dict(_forwarded_api_env())
 
     # Alternative provider: build env from settings
     provider = API_PROVIDERS.get(provider_id)
     if not provider:
         logger.warning("Unknown API provider '%s', falling back to claude", provider_id)
-        from env_constants import API_ENV_VARS
-        sdk_env = {}
-        for var in API_ENV_VARS:
-            value = os.getenv(var)
-            if value:
-                sdk_env[var] = value
-        return sdk_env
+        return dict(_forwarded_api_env())
 
     sdk_env: dict[str, str] = {}
 
@@ -12,6 +12,7 @@ import os
 import shutil
 import sys
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 
 # Fix for Windows subprocess support in asyncio
@@ -191,6 +192,17 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@lru_cache(maxsize=1)
+def _glm_env_configured() -> bool:
+    """Check once whether GLM credentials are configured via .env.
+
+    The .env is loaded at startup and these vars don't change while the
+    server runs, so skip the libc getenv calls on every status poll.
+    Tests can reset with _glm_env_configured.cache_clear().
+    """
+    return bool(os.getenv("ANTHROPIC_BASE_URL") and os.getenv("ANTHROPIC_AUTH_TOKEN"))
+
+
 @app.get("/api/setup/status", response_model=SetupStatus)
 async def setup_status():
     """Check system setup status."""
@@ -204,8 +216,7 @@ async def setup_status():
     has_claude_config = claude_dir.exists() and claude_dir.is_dir()
 
     # If GLM mode is configured via .env, we have alternative credentials
-    glm_configured = bool(os.getenv("ANTHROPIC_BASE_URL") and os.getenv("ANTHROPIC_AUTH_TOKEN"))
-    credentials = has_claude_config or glm_configured
+    credentials = has_claude_config or _glm_env_configured()
 
     # Check for Node.js and npm
     node = shutil.which("node") is not None
@@ -10,10 +10,11 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..services.assistant_chat_session import (
     AssistantChatSession,
+    TextChunk,
     create_session,
     get_session,
     list_sessions,
@@ -25,6 +26,7 @@ from ..services.assistant_database import (
     get_conversation,
     get_conversations,
 )
+from ..utils.json_utils import dumps, loads
 from ..utils.project_helpers import get_project_path as _get_project_path
 from ..utils.validation import validate_project_name
 
@@ -33,12 +35,40 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/assistant", tags=["assistant-chat"])
 
 
+async def _ws_send(websocket: WebSocket, payload: dict) -> None:
+    """Send a payload as a text frame, serialized with orjson.
+
+    Replaces websocket.send_json, whose stdlib json.dumps dominates CPU on
+    the token-per-chunk streaming path.
+    """
+    await websocket.send_text(dumps(payload))
+
+
+# Envelope for the per-token text fast path; only the content needs
+# serializing since the wrapper never changes
+_TEXT_PREFIX = '{"type":"text","content":'
+
+
+async def _send_chunk(websocket: WebSocket, chunk: TextChunk | dict) -> None:
+    """Relay one streamed chunk, fast-pathing the common text case.
+
+    TextChunk instances skip the generic dict encode: the envelope is a
+    constant and only the content string goes through the serializer.
+    """
+    if isinstance(chunk, TextChunk):
+        await websocket.send_text(_TEXT_PREFIX + dumps(chunk.content) + "}")
+    else:
+        await _ws_send(websocket, chunk)
+
+
 # ============================================================================
 # Pydantic Models
 # ============================================================================
 
 class ConversationSummary(BaseModel):
     """Summary of a conversation."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_name: str
     title: Optional[str]
@@ -49,6 +79,8 @@ class ConversationSummary(BaseModel):
 
 class ConversationMessageModel(BaseModel):
     """A message within a conversation."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     role: str
     content: str
@@ -57,6 +89,8 @@ class ConversationMessageModel(BaseModel):
 
 class ConversationDetail(BaseModel):
     """Full conversation with messages."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_name: str
     title: Optional[str]
@@ -87,7 +121,8 @@ async def list_project_conversations(project_name: str):
         raise HTTPException(status_code=404, detail="Project not found")
 
     conversations = get_conversations(project_dir, project_name)
-    return [ConversationSummary(**c) for c in conversations]
+    # model_validate goes straight through pydantic-core's Rust validator
+    return [ConversationSummary.model_validate(c) for c in conversations]
 
 
 @router.get("/conversations/{project_name}/{conversation_id}", response_model=ConversationDetail)
@@ -110,7 +145,7 @@ async def get_project_conversation(project_name: str, conversation_id: int):
         title=conversation["title"],
         created_at=conversation["created_at"],
         updated_at=conversation["updated_at"],
-        messages=[ConversationMessageModel(**m) for m in conversation["messages"]],
+        messages=[ConversationMessageModel.model_validate(m) for m in conversation["messages"]],
     )
 
 
@@ -225,18 +260,18 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
     try:
         project_name = validate_project_name(project_name)
     except HTTPException:
-        await websocket.send_json({"type": "error", "content": "Invalid project name"})
+        await _ws_send(websocket, {"type": "error", "content": "Invalid project name"})
         await websocket.close(code=4000, reason="Invalid project name")
         return
 
     project_dir = _get_project_path(project_name)
     if not project_dir:
-        await websocket.send_json({"type": "error", "content": "Project not found in registry"})
+        await _ws_send(websocket, {"type": "error", "content": "Project not found in registry"})
         await websocket.close(code=4004, reason="Project not found in registry")
         return
 
     if not project_dir.exists():
-        await websocket.send_json({"type": "error", "content": "Project directory not found"})
+        await _ws_send(websocket, {"type": "error", "content": "Project directory not found"})
         await websocket.close(code=4004, reason="Project directory not found")
         return
     logger.info(f"Assistant WebSocket connected for project: {project_name}")
@@ -247,12 +282,14 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
         while True:
             try:
                 data = await websocket.receive_text()
-                message = json.loads(data)
+                # orjson parses in C; its JSONDecodeError subclasses the
+                # stdlib one, so the except branch below still applies
+                message = loads(data)
                 msg_type = message.get("type")
                 logger.debug(f"Assistant received message type: {msg_type}")
 
                 if msg_type == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await _ws_send(websocket, {"type": "pong"})
                     continue
 
                 elif msg_type == "start":
@@ -270,15 +307,18 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
                         )
                         logger.debug("Session created, starting...")
 
-                        # Stream the initial greeting
+                        # Stream the initial greeting. Capture the debug flag
+                        # once; the level doesn't change mid-loop
+                        debug_enabled = logger.isEnabledFor(logging.DEBUG)
                         async for chunk in session.start():
-                            if logger.isEnabledFor(logging.DEBUG):
-                                logger.debug(f"Sending chunk: {chunk.get('type')}")
-                            await websocket.send_json(chunk)
+                            if debug_enabled:
+                                chunk_type = "text" if isinstance(chunk, TextChunk) else chunk.get("type")
+                                logger.debug(f"Sending chunk: {chunk_type}")
+                            await _send_chunk(websocket, chunk)
                         logger.debug("Session start complete")
                     except Exception as e:
                         logger.exception(f"Error starting assistant session for {project_name}")
-                        await websocket.send_json({
+                        await _ws_send(websocket, {
                             "type": "error",
                             "content": f"Failed to start session: {str(e)}"
                         })
@@ -287,7 +327,7 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
                     if not session:
                         session = get_session(project_name)
                         if not session:
-                            await websocket.send_json({
+                            await _ws_send(websocket, {
                                 "type": "error",
                                 "content": "No active session. Send 'start' first."
                             })
@@ -295,7 +335,7 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
 
                     user_content = message.get("content", "").strip()
                     if not user_content:
-                        await websocket.send_json({
+                        await _ws_send(websocket, {
                             "type": "error",
                             "content": "Empty message"
                         })
@@ -303,14 +343,14 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
 
                     # Stream Claude's response
                     async for chunk in session.send_message(user_content):
-                        await websocket.send_json(chunk)
+                        await _send_chunk(websocket, chunk)
 
                 elif msg_type == "answer":
                     # User answered a structured question
                     if not session:
                         session = get_session(project_name)
                         if not session:
-                            await websocket.send_json({
+                            await _ws_send(websocket, {
                                 "type": "error",
                                 "content": "No active session. Send 'start' first."
                             })
@@ -319,28 +359,26 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
                     # Format the answers as a natural response
                     answers = message.get("answers", {})
                     if isinstance(answers, dict):
-                        response_parts = []
-                        for question_idx, answer_value in answers.items():
-                            if isinstance(answer_value, list):
-                                response_parts.append(", ".join(answer_value))
-                            else:
-                                response_parts.append(str(answer_value))
-                        user_response = "; ".join(response_parts) if response_parts else "OK"
+                        # Question indices are unused, so iterate values only
+                        user_response = "; ".join(
+                            ", ".join(map(str, v)) if isinstance(v, list) else str(v)
+                            for v in answers.values()
+                        ) or "OK"
                     else:
                         user_response = str(answers)
 
                     # Stream Claude's response
                     async for chunk in session.send_message(user_response):
-                        await websocket.send_json(chunk)
+                        await _send_chunk(websocket, chunk)
 
                 else:
-                    await websocket.send_json({
+                    await _ws_send(websocket, {
                         "type": "error",
                         "content": f"Unknown message type: {msg_type}"
                     })
 
             except json.JSONDecodeError:
-                await websocket.send_json({
+                await _ws_send(websocket, {
                     "type": "error",
                     "content": "Invalid JSON"
                 })
@@ -351,7 +389,7 @@ async def assistant_chat_websocket(websocket: WebSocket, project_name: str):
     except Exception as e:
         logger.exception(f"Assistant chat WebSocket error for {project_name}")
         try:
-            await websocket.send_json({
+            await _ws_send(websocket, {
                 "type": "error",
                 "content": f"Server error: {str(e)}"
             })
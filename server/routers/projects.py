@@ -23,6 +23,7 @@ from ..schemas import (
     ProjectStats,
     ProjectSummary,
 )
+from ..utils.project_helpers import invalidate_project_path_cache
 
 # Lazy imports to avoid circular dependencies
 # These are initialized by _init_imports() before first use.
@@ -217,6 +218,9 @@ async def create_project(project: ProjectCreate):
             detail=f"Failed to register project: {e}"
         )
 
+    # Drop any stale cached lookup for this name
+    invalidate_project_path_cache(name)
+
     return ProjectSummary(
         name=name,
         path=project_path.as_posix(),
@@ -292,6 +296,7 @@ async def delete_project(name: str, delete_files: bool = False):
 
     # Unregister from registry
     unregister_project(name)
+    invalidate_project_path_cache(name)
 
     return {
         "success": True,
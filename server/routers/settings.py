@@ -27,7 +27,7 @@ from registry import (
     DEFAULT_MODEL,
     get_all_settings,
     get_setting,
-    set_setting,
+    set_settings,
 )
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
@@ -38,21 +38,42 @@ def _parse_yolo_mode(value: str | None) -> bool:
     return (value or "false").lower() == "true"
 
 
+# Provider/model payloads are static for the life of the process, so build
+# them once at import instead of re-running Pydantic validation per request.
+_PROVIDER_INFOS: list[ProviderInfo] = [
+    ProviderInfo(
+        id=pid,
+        name=pdata["name"],
+        base_url=pdata.get("base_url"),
+        models=[ModelInfo(id=m["id"], name=m["name"]) for m in pdata.get("models", [])],
+        default_model=pdata.get("default_model", ""),
+        requires_auth=pdata.get("requires_auth", False),
+    )
+    for pid, pdata in API_PROVIDERS.items()
+]
+
+_CLAUDE_MODELS_RESPONSE = ModelsResponse(
+    models=[ModelInfo(id=m["id"], name=m["name"]) for m in AVAILABLE_MODELS],
+    default=DEFAULT_MODEL,
+)
+
+_MODELS_BY_PROVIDER: dict[str, ModelsResponse] = {
+    pid: ModelsResponse(
+        models=[ModelInfo(id=m["id"], name=m["name"]) for m in pdata.get("models", [])],
+        default=pdata.get("default_model", ""),
+    )
+    for pid, pdata in API_PROVIDERS.items()
+    if pid != "claude"
+}
+
+
 @router.get("/providers", response_model=ProvidersResponse)
 async def get_available_providers():
     """Get list of available API providers."""
     current = get_setting("api_provider", "claude") or "claude"
-    providers = []
-    for pid, pdata in API_PROVIDERS.items():
-        providers.append(ProviderInfo(
-            id=pid,
-            name=pdata["name"],
-            base_url=pdata.get("base_url"),
-            models=[ModelInfo(id=m["id"], name=m["name"]) for m in pdata.get("models", [])],
-            default_model=pdata.get("default_model", ""),
-            requires_auth=pdata.get("requires_auth", False),
-        ))
-    return ProvidersResponse(providers=providers, current=current)
+    # Only `current` varies; model_construct skips re-validating the
+    # precomputed provider list
+    return ProvidersResponse.model_construct(providers=_PROVIDER_INFOS, current=current)
 
 
 @router.get("/models", response_model=ModelsResponse)
@@ -62,20 +83,7 @@ async def get_available_models():
     Returns models for the currently selected API provider.
     """
     current_provider = get_setting("api_provider", "claude") or "claude"
-    provider = API_PROVIDERS.get(current_provider)
-
-    if provider and current_provider != "claude":
-        provider_models = provider.get("models", [])
-        return ModelsResponse(
-            models=[ModelInfo(id=m["id"], name=m["name"]) for m in provider_models],
-            default=provider.get("default_model", ""),
-        )
-
-    # Default: return Claude models
-    return ModelsResponse(
-        models=[ModelInfo(id=m["id"], name=m["name"]) for m in AVAILABLE_MODELS],
-        default=DEFAULT_MODEL,
-    )
+    return _MODELS_BY_PROVIDER.get(current_provider, _CLAUDE_MODELS_RESPONSE)
 
 
 def _parse_int(value: str | None, default: int) -> int:
@@ -95,21 +103,19 @@ def _parse_bool(value: str | None, default: bool = False) -> bool:
     return value.lower() == "true"
 
 
-@router.get("", response_model=SettingsResponse)
-async def get_settings():
-    """Get current global settings."""
-    all_settings = get_all_settings()
+def _build_settings_response(all_settings: dict[str, str]) -> SettingsResponse:
+    """Build a SettingsResponse from a settings snapshot.
 
+    Values come from the typed parse helpers above, so model_construct
+    safely skips Pydantic validation on this per-poll response.
+    """
     api_provider = all_settings.get("api_provider", "claude")
 
-    glm_mode = api_provider == "glm"
-    ollama_mode = api_provider == "ollama"
-
-    return SettingsResponse(
+    return SettingsResponse.model_construct(
         yolo_mode=_parse_yolo_mode(all_settings.get("yolo_mode")),
         model=all_settings.get("model", DEFAULT_MODEL),
-        glm_mode=glm_mode,
-        ollama_mode=ollama_mode,
+        glm_mode=api_provider == "glm",
+        ollama_mode=api_provider == "ollama",
         testing_agent_ratio=_parse_int(all_settings.get("testing_agent_ratio"), 1),
         playwright_headless=_parse_bool(all_settings.get("playwright_headless"), default=True),
         batch_size=_parse_int(all_settings.get("batch_size"), 3),
@@ -120,65 +126,65 @@ async def get_settings():
     )
 
 
+@router.get("", response_model=SettingsResponse)
+async def get_settings():
+    """Get current global settings."""
+    return _build_settings_response(get_all_settings())
+
+
 @router.patch("", response_model=SettingsResponse)
 async def update_settings(update: SettingsUpdate):
     """Update global settings."""
+    # Snapshot once, diff against it, and write only the fields that actually
+    # changed in a single transaction. UI saves typically touch one or two
+    # settings, so this skips most of the per-key registry writes.
+    current = get_all_settings()
+    changes: dict[str, str] = {}
+
+    def stage(key: str, value: str) -> None:
+        if current.get(key) != value:
+            changes[key] = value
+
     if update.yolo_mode is not None:
-        set_setting("yolo_mode", "true" if update.yolo_mode else "false")
+        stage("yolo_mode", "true" if update.yolo_mode else "false")
 
     if update.model is not None:
-        set_setting("model", update.model)
+        stage("model", update.model)
 
     if update.testing_agent_ratio is not None:
-        set_setting("testing_agent_ratio", str(update.testing_agent_ratio))
+        stage("testing_agent_ratio", str(update.testing_agent_ratio))
 
     if update.playwright_headless is not None:
-        set_setting("playwright_headless", "true" if update.playwright_headless else "false")
+        stage("playwright_headless", "true" if update.playwright_headless else "false")
 
     if update.batch_size is not None:
-        set_setting("batch_size", str(update.batch_size))
+        stage("batch_size", str(update.batch_size))
 
     # API provider settings
     if update.api_provider is not None:
-        old_provider = get_setting("api_provider", "claude")
-        set_setting("api_provider", update.api_provider)
+        stage("api_provider", update.api_provider)
 
         # When provider changes, auto-set defaults for the new provider
-        if update.api_provider != old_provider:
+        if update.api_provider != current.get("api_provider", "claude"):
             provider = API_PROVIDERS.get(update.api_provider)
             if provider:
                 # Auto-set base URL from provider definition
                 if provider.get("base_url"):
-                    set_setting("api_base_url", provider["base_url"])
+                    stage("api_base_url", provider["base_url"])
                 # Auto-set model to provider's default
                 if provider.get("default_model") and update.api_model is None:
-                    set_setting("api_model", provider["default_model"])
+                    stage("api_model", provider["default_model"])
 
     if update.api_base_url is not None:
-        set_setting("api_base_url", update.api_base_url)
+        stage("api_base_url", update.api_base_url)
 
     if update.api_auth_token is not None:
-        set_setting("api_auth_token", update.api_auth_token)
+        stage("api_auth_token", update.api_auth_token)
 
     if update.api_model is not None:
-        set_setting("api_model", update.api_model)
+        stage("api_model", update.api_model)
 
-    # Return updated settings
-    all_settings = get_all_settings()
-    api_provider = all_settings.get("api_provider", "claude")
-    glm_mode = api_provider == "glm"
-    ollama_mode = api_provider == "ollama"
+    set_settings(changes)
 
-    return SettingsResponse(
-        yolo_mode=_parse_yolo_mode(all_settings.get("yolo_mode")),
-        model=all_settings.get("model", DEFAULT_MODEL),
-        glm_mode=glm_mode,
-        ollama_mode=ollama_mode,
-        testing_agent_ratio=_parse_int(all_settings.get("testing_agent_ratio"), 1),
-        playwright_headless=_parse_bool(all_settings.get("playwright_headless"), default=True),
-        batch_size=_parse_int(all_settings.get("batch_size"), 3),
-        api_provider=api_provider,
-        api_base_url=all_settings.get("api_base_url"),
-        api_has_auth_token=bool(all_settings.get("api_auth_token")),
-        api_model=all_settings.get("api_model"),
-    )
+    # Return updated settings without a second registry round-trip
+    return _build_settings_response(current | changes)
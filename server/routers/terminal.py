@@ -8,12 +8,11 @@ Supports multiple terminals per project with create, list, rename, delete operat
 """
 
 import asyncio
-import base64
-import json
 import logging
-import re
+from binascii import a2b_base64
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Path, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 from ..services.terminal_manager import (
@@ -25,13 +24,25 @@ from ..services.terminal_manager import (
     rename_terminal,
     stop_terminal_session,
 )
+from ..utils.json_utils import dumps, loads
 from ..utils.project_helpers import get_project_path as _get_project_path
-from ..utils.validation import is_valid_project_name
+from ..utils.validation import PROJECT_NAME_PATTERN, is_valid_project_name
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/terminal", tags=["terminal"])
 
+# Binary frame type prefix for PTY output (leaves room for future frame types)
+_OUTPUT_PREFIX = b"\x01"
+
+# 64KB cap on a single input payload to prevent DoS
+_MAX_INPUT_BYTES = 65536
+
+
+async def _ws_send(websocket: WebSocket, payload: dict) -> None:
+    """Send a control payload as a text frame, serialized with orjson."""
+    await websocket.send_text(dumps(payload))
+
 
 class TerminalCloseCode:
     """WebSocket close codes for terminal endpoint."""
@@ -43,7 +54,10 @@ class TerminalCloseCode:
 
 def validate_terminal_id(terminal_id: str) -> bool:
     """
-    Validate terminal ID format.
+    Validate terminal ID format (1-16 ASCII alphanumeric characters).
+
+    Uses C-level str methods instead of a regex; this runs on every REST
+    request and WebSocket handshake.
 
     Args:
         terminal_id: The terminal ID to validate
@@ -51,7 +65,14 @@ def validate_terminal_id(terminal_id: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    return bool(re.match(r"^[a-zA-Z0-9]{1,16}$", terminal_id))
+    return 0 < len(terminal_id) <= 16 and terminal_id.isascii() and terminal_id.isalnum()
+
+
+# Path-parameter types validated by FastAPI at routing time, before the
+# handler coroutine is scheduled. The WebSocket handler keeps imperative
+# checks since it must close the socket with a code instead of raising.
+ProjectNamePath = Annotated[str, Path(pattern=PROJECT_NAME_PATTERN)]
+TerminalIdPath = Annotated[str, Path(pattern=r"^[a-zA-Z0-9]{1,16}$")]
 
 
 # Pydantic models for request/response bodies
@@ -79,7 +100,7 @@ class TerminalInfoResponse(BaseModel):
 
 
 @router.get("/{project_name}")
-async def list_project_terminals(project_name: str) -> list[TerminalInfoResponse]:
+async def list_project_terminals(project_name: ProjectNamePath) -> list[TerminalInfoResponse]:
     """
     List all terminals for a project.
 
@@ -89,9 +110,6 @@ async def list_project_terminals(project_name: str) -> list[TerminalInfoResponse
     Returns:
         List of terminal info objects
     """
-    if not is_valid_project_name(project_name):
-        raise HTTPException(status_code=400, detail="Invalid project name")
-
     project_dir = _get_project_path(project_name)
     if not project_dir:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -103,14 +121,17 @@ async def list_project_terminals(project_name: str) -> list[TerminalInfoResponse
         info = create_terminal(project_name)
         terminals = [info]
 
+    # Fields come pre-typed from TerminalInfo; model_construct skips
+    # re-validating each row
     return [
-        TerminalInfoResponse(id=t.id, name=t.name, created_at=t.created_at) for t in terminals
+        TerminalInfoResponse.model_construct(id=t.id, name=t.name, created_at=t.created_at_iso())
+        for t in terminals
     ]
 
 
 @router.post("/{project_name}")
 async def create_project_terminal(
-    project_name: str, request: CreateTerminalRequest
+    project_name: ProjectNamePath, request: CreateTerminalRequest
 ) -> TerminalInfoResponse:
     """
     Create a new terminal for a project.
@@ -122,20 +143,17 @@ async def create_project_terminal(
     Returns:
         The created terminal info
     """
-    if not is_valid_project_name(project_name):
-        raise HTTPException(status_code=400, detail="Invalid project name")
-
     project_dir = _get_project_path(project_name)
     if not project_dir:
         raise HTTPException(status_code=404, detail="Project not found")
 
     info = create_terminal(project_name, request.name)
-    return TerminalInfoResponse(id=info.id, name=info.name, created_at=info.created_at)
+    return TerminalInfoResponse.model_construct(id=info.id, name=info.name, created_at=info.created_at_iso())
 
 
 @router.patch("/{project_name}/{terminal_id}")
 async def rename_project_terminal(
-    project_name: str, terminal_id: str, request: RenameTerminalRequest
+    project_name: ProjectNamePath, terminal_id: TerminalIdPath, request: RenameTerminalRequest
 ) -> TerminalInfoResponse:
     """
     Rename a terminal.
@@ -148,12 +166,6 @@ async def rename_project_terminal(
     Returns:
         The updated terminal info
     """
-    if not is_valid_project_name(project_name):
-        raise HTTPException(status_code=400, detail="Invalid project name")
-
-    if not validate_terminal_id(terminal_id):
-        raise HTTPException(status_code=400, detail="Invalid terminal ID")
-
     project_dir = _get_project_path(project_name)
     if not project_dir:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -165,11 +177,11 @@ async def rename_project_terminal(
     if not info:
         raise HTTPException(status_code=404, detail="Terminal not found")
 
-    return TerminalInfoResponse(id=info.id, name=info.name, created_at=info.created_at)
+    return TerminalInfoResponse.model_construct(id=info.id, name=info.name, created_at=info.created_at_iso())
 
 
 @router.delete("/{project_name}/{terminal_id}")
-async def delete_project_terminal(project_name: str, terminal_id: str) -> dict:
+async def delete_project_terminal(project_name: ProjectNamePath, terminal_id: TerminalIdPath) -> dict:
     """
     Delete a terminal and stop its session.
 
@@ -180,12 +192,6 @@ async def delete_project_terminal(project_name: str, terminal_id: str) -> dict:
     Returns:
         Success message
     """
-    if not is_valid_project_name(project_name):
-        raise HTTPException(status_code=400, detail="Invalid project name")
-
-    if not validate_terminal_id(terminal_id):
-        raise HTTPException(status_code=400, detail="Invalid terminal ID")
-
     project_dir = _get_project_path(project_name)
     if not project_dir:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -211,22 +217,33 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     Message protocol:
 
     Client -> Server:
-    - {"type": "input", "data": "<base64-encoded-bytes>"} - Keyboard input
+    - binary frame: raw keyboard input bytes (preferred hot path)
+    - {"type": "input", "data": "<base64-encoded-bytes>"} - Keyboard input (legacy)
     - {"type": "resize", "cols": 80, "rows": 24} - Terminal resize
+    - {"type": "start", "cols": 80, "rows": 24} - Explicit session start
     - {"type": "ping"} - Keep-alive ping
 
+    When the session is not yet running, the first start/resize message
+    creates the PTY with those dimensions; input sent earlier is rejected
+    with a "not ready" error.
+
     Server -> Client:
-    - {"type": "output", "data": "<base64-encoded-bytes>"} - PTY output
+    - binary frame: 0x01 prefix byte followed by raw PTY output bytes
     - {"type": "exit", "code": 0} - Shell process exited
     - {"type": "pong"} - Keep-alive response
     - {"type": "error", "message": "..."} - Error message
+
+    PTY output and keyboard input travel as raw binary frames; base64+JSON
+    framing cost ~4/3x bandwidth plus encode/escape CPU per chunk, which
+    dominated under bursty output like build logs. JSON text frames remain
+    for low-rate control messages.
     """
     # Always accept WebSocket first to avoid opaque 403 errors
     await websocket.accept()
 
     # Validate project name
     if not is_valid_project_name(project_name):
-        await websocket.send_json({"type": "error", "message": "Invalid project name"})
+        await _ws_send(websocket, {"type": "error", "message": "Invalid project name"})
         await websocket.close(
             code=TerminalCloseCode.INVALID_PROJECT_NAME, reason="Invalid project name"
         )
@@ -234,7 +251,7 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
 
     # Validate terminal ID
     if not validate_terminal_id(terminal_id):
-        await websocket.send_json({"type": "error", "message": "Invalid terminal ID"})
+        await _ws_send(websocket, {"type": "error", "message": "Invalid terminal ID"})
         await websocket.close(
             code=TerminalCloseCode.INVALID_PROJECT_NAME, reason="Invalid terminal ID"
         )
@@ -243,7 +260,7 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     # Look up project directory from registry
     project_dir = _get_project_path(project_name)
     if not project_dir:
-        await websocket.send_json({"type": "error", "message": "Project not found in registry"})
+        await _ws_send(websocket, {"type": "error", "message": "Project not found in registry"})
         await websocket.close(
             code=TerminalCloseCode.PROJECT_NOT_FOUND,
             reason="Project not found in registry",
@@ -251,7 +268,7 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
         return
 
     if not project_dir.exists():
-        await websocket.send_json({"type": "error", "message": "Project directory not found"})
+        await _ws_send(websocket, {"type": "error", "message": "Project directory not found"})
         await websocket.close(
             code=TerminalCloseCode.PROJECT_NOT_FOUND,
             reason="Project directory not found",
@@ -261,7 +278,7 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     # Verify terminal exists in metadata
     terminal_info = get_terminal_info(project_name, terminal_id)
     if not terminal_info:
-        await websocket.send_json({"type": "error", "message": "Terminal not found"})
+        await _ws_send(websocket, {"type": "error", "message": "Terminal not found"})
         await websocket.close(
             code=TerminalCloseCode.PROJECT_NOT_FOUND,
             reason="Terminal not found",
@@ -271,8 +288,9 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     # Get or create terminal session for this project/terminal
     session = get_terminal_session(project_name, project_dir, terminal_id)
 
-    # Queue for output data to send to client
-    output_queue: asyncio.Queue[bytes] = asyncio.Queue()
+    # Queue for output data to send to client. Bounded so a stalled client
+    # applies real backpressure (drops) instead of unbounded memory growth.
+    output_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=256)
 
     # Callback to receive terminal output and queue it for sending
     def on_output(data: bytes) -> None:
@@ -285,21 +303,27 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     # Register the output callback
     session.add_output_callback(on_output)
 
-    # Track if we need to wait for initial resize before starting
-    # This ensures the PTY is created with correct dimensions from the start
-    needs_initial_resize = not session.is_active
-
     # Task to send queued output to WebSocket
     async def send_output_task() -> None:
-        """Continuously send queued output to the WebSocket client."""
+        """Continuously send queued output to the WebSocket client.
+
+        Coalesces all chunks already queued behind the first one into a
+        single frame (capped at 64KB), so bursty output like build logs
+        doesn't cost one frame + coroutine wakeup per small PTY read.
+        """
         try:
             while True:
-                # Wait for output data
-                data = await output_queue.get()
-
-                # Encode as base64 and send
-                encoded = base64.b64encode(data).decode("ascii")
-                await websocket.send_json({"type": "output", "data": encoded})
+                # Wait for output data, then drain whatever else is pending
+                buf = bytearray(_OUTPUT_PREFIX)
+                buf += await output_queue.get()
+                while len(buf) <= 65536:
+                    try:
+                        buf += output_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+
+                # Raw binary frame: type prefix + PTY bytes, no base64/JSON
+                await websocket.send_bytes(bytes(buf))
 
         except asyncio.CancelledError:
             raise
@@ -313,17 +337,14 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     async def monitor_exit_task() -> None:
         """Monitor the terminal session and notify client on exit."""
         try:
-            # Wait for session to become active first (deferred start)
-            while not session.is_active:
-                await asyncio.sleep(0.1)
-
-            # Now monitor until it becomes inactive
-            while session.is_active:
-                await asyncio.sleep(0.5)
+            # Await lifecycle events instead of polling is_active; one wakeup
+            # per transition rather than two per second per idle client
+            await session.started_event.wait()
+            await session.stopped_event.wait()
 
             # Session ended - send exit message
             # Note: We don't have access to actual exit code from PTY
-            await websocket.send_json({"type": "exit", "code": 0})
+            await _ws_send(websocket, {"type": "exit", "code": 0})
 
         except asyncio.CancelledError:
             raise
@@ -337,37 +358,112 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     exit_task = asyncio.create_task(monitor_exit_task())
 
     try:
+        # Startup phase: wait for the first start/resize message so the PTY
+        # is created with the client's real dimensions, handled once here
+        # instead of branching on lifecycle state for every later message
+        while not session.is_active:
+            raw = await websocket.receive()
+            if raw["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(raw.get("code") or 1000)
+
+            if raw.get("bytes") is not None:
+                await _ws_send(
+                    websocket,
+                    {"type": "error", "message": "Terminal not ready - send resize first"},
+                )
+                continue
+
+            try:
+                message = loads(raw.get("text") or "")
+            except ValueError:
+                await _ws_send(websocket, {"type": "error", "message": "Invalid JSON"})
+                continue
+            msg_type = message.get("type")
+
+            if msg_type == "ping":
+                await _ws_send(websocket, {"type": "pong"})
+                continue
+
+            if msg_type not in ("start", "resize"):
+                await _ws_send(
+                    websocket,
+                    {"type": "error", "message": "Terminal not ready - send resize first"},
+                )
+                continue
+
+            cols = message.get("cols", 80)
+            rows = message.get("rows", 24)
+            if not (isinstance(cols, int) and isinstance(rows, int)):
+                await _ws_send(websocket, {"type": "error", "message": "Invalid resize dimensions"})
+                continue
+
+            cols = max(10, min(500, cols))
+            rows = max(5, min(200, rows))
+            started = await session.start(cols=cols, rows=rows)
+            if not started:
+                session.remove_output_callback(on_output)
+                try:
+                    await _ws_send(
+                        websocket,
+                        {"type": "error", "message": "Failed to start terminal session"},
+                    )
+                except Exception:
+                    pass
+                await websocket.close(
+                    code=TerminalCloseCode.FAILED_TO_START, reason="Failed to start terminal"
+                )
+                return
+
+        # Steady-state loop: only input/resize/ping, no lifecycle branching.
+        # If the shell exits mid-connection, session.write becomes a no-op
+        # and the exit monitor notifies the client.
         while True:
             try:
-                # Receive message from client
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                # Receive raw message so binary input frames skip JSON entirely
+                raw = await websocket.receive()
+                if raw["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(raw.get("code") or 1000)
+
+                raw_bytes = raw.get("bytes")
+                if raw_bytes is not None:
+                    # Binary frame: raw keyboard input bytes
+                    if len(raw_bytes) > _MAX_INPUT_BYTES:
+                        await _ws_send(websocket, {"type": "error", "message": "Input too large"})
+                        continue
+                    if raw_bytes:
+                        try:
+                            session.write(raw_bytes)
+                        except Exception as e:
+                            logger.warning(f"Failed to write to terminal: {e}")
+                            await _ws_send(
+                                websocket,
+                                {"type": "error", "message": "Failed to write to terminal"},
+                            )
+                    continue
+
+                message = loads(raw.get("text") or "")
                 msg_type = message.get("type")
 
                 if msg_type == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await _ws_send(websocket, {"type": "pong"})
 
                 elif msg_type == "input":
-                    # Only allow input after terminal is started
-                    if not session.is_active:
-                        await websocket.send_json(
-                            {"type": "error", "message": "Terminal not ready - send resize first"}
-                        )
-                        continue
-
+                    # Legacy JSON input path (base64-encoded bytes)
                     # Decode base64 input and write to PTY
                     encoded_data = message.get("data", "")
                     # Add size limit to prevent DoS
-                    if len(encoded_data) > 65536:  # 64KB limit for base64 encoded data
-                        await websocket.send_json({"type": "error", "message": "Input too large"})
+                    if len(encoded_data) > _MAX_INPUT_BYTES:
+                        await _ws_send(websocket, {"type": "error", "message": "Input too large"})
                         continue
                     if encoded_data:
                         try:
-                            decoded = base64.b64decode(encoded_data)
+                            # C-level decode; skips b64decode's validation
+                            # wrapper (binascii.Error subclasses ValueError)
+                            decoded = a2b_base64(encoded_data)
                         except (ValueError, TypeError) as e:
                             logger.warning(f"Failed to decode base64 input: {e}")
-                            await websocket.send_json(
-                                {"type": "error", "message": "Invalid base64 data"}
+                            await _ws_send(
+                                websocket, {"type": "error", "message": "Invalid base64 data"}
                             )
                             continue
 
@@ -375,8 +471,9 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
                             session.write(decoded)
                         except Exception as e:
                             logger.warning(f"Failed to write to terminal: {e}")
-                            await websocket.send_json(
-                                {"type": "error", "message": "Failed to write to terminal"}
+                            await _ws_send(
+                                websocket,
+                                {"type": "error", "message": "Failed to write to terminal"},
                             )
 
                 elif msg_type == "resize":
@@ -388,35 +485,16 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
                     if isinstance(cols, int) and isinstance(rows, int):
                         cols = max(10, min(500, cols))
                         rows = max(5, min(200, rows))
-
-                        # If this is the first resize and session not started, start with these dimensions
-                        # This ensures the PTY is created with correct size from the beginning
-                        if needs_initial_resize and not session.is_active:
-                            started = await session.start(cols=cols, rows=rows)
-                            if not started:
-                                session.remove_output_callback(on_output)
-                                try:
-                                    await websocket.send_json(
-                                        {"type": "error", "message": "Failed to start terminal session"}
-                                    )
-                                except Exception:
-                                    pass
-                                await websocket.close(
-                                    code=TerminalCloseCode.FAILED_TO_START, reason="Failed to start terminal"
-                                )
-                                return
-                            # Mark that we no longer need initial resize
-                            needs_initial_resize = False
-                        else:
-                            session.resize(cols, rows)
+                        session.resize(cols, rows)
                     else:
-                        await websocket.send_json({"type": "error", "message": "Invalid resize dimensions"})
+                        await _ws_send(websocket, {"type": "error", "message": "Invalid resize dimensions"})
 
                 else:
-                    await websocket.send_json({"type": "error", "message": f"Unknown message type: {msg_type}"})
+                    await _ws_send(websocket, {"type": "error", "message": f"Unknown message type: {msg_type}"})
 
-            except json.JSONDecodeError:
-                await websocket.send_json({"type": "error", "message": "Invalid JSON"})
+            except ValueError:
+                # Covers both orjson.JSONDecodeError and stdlib json fallback
+                await _ws_send(websocket, {"type": "error", "message": "Invalid JSON"})
 
     except WebSocketDisconnect:
         logger.info(f"Terminal WebSocket disconnected for {project_name}/{terminal_id}")
@@ -424,7 +502,7 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     except Exception as e:
         logger.exception(f"Terminal WebSocket error for {project_name}/{terminal_id}")
         try:
-            await websocket.send_json({"type": "error", "message": f"Server error: {str(e)}"})
+            await _ws_send(websocket, {"type": "error", "message": f"Server error: {str(e)}"})
         except Exception:
             pass
 
@@ -443,12 +521,9 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
         except asyncio.CancelledError:
             pass
 
-        # Remove the output callback
-        session.remove_output_callback(on_output)
-
-        # Only stop session if no other clients are connected
-        with session._callbacks_lock:
-            remaining_callbacks = len(session._output_callbacks)
+        # Remove the output callback and stop the session only if no other
+        # clients are connected (one lock hold instead of two)
+        remaining_callbacks = session.remove_output_callback_and_count(on_output)
 
         if remaining_callbacks == 0:
             await session.stop()
@@ -7,19 +7,30 @@ The assistant can answer questions about the codebase and features
 but cannot modify any files.
 """
 
-import json
+import asyncio
 import logging
 import os
 import shutil
 import sys
-import threading
-from datetime import datetime
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncGenerator, Optional
 
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeAgentOptions,
+    ClaudeSDKClient,
+    StreamEvent,
+    TextBlock,
+    ToolUseBlock,
+)
 from dotenv import load_dotenv
 
+from ..utils.file_utils import write_bytes_if_changed
+from ..utils.json_utils import dumps
 from .assistant_database import (
     add_message,
     create_conversation,
@@ -64,6 +75,78 @@ READONLY_BUILTIN_TOOLS = [
     "WebSearch",
 ]
 
+# Session-start constants, built once at import instead of per session
+
+# Resolved once: which() stats every $PATH entry on each call
+_SYSTEM_CLI = shutil.which("claude")
+
+# Repo root resolved once; Path.resolve() stats every path component
+_ROOT_STR = str(ROOT_DIR.resolve())
+
+# Permissions list for assistant access (read + feature management)
+_PERMISSIONS_LIST = [
+    "Read(./**)",
+    "Glob(./**)",
+    "Grep(./**)",
+    "WebFetch",
+    "WebSearch",
+    *ASSISTANT_FEATURE_TOOLS,
+]
+
+_ALLOWED_TOOLS = (*READONLY_BUILTIN_TOOLS, *ASSISTANT_FEATURE_TOOLS)
+
+# Security settings file content, pre-serialized
+# Compact output -- the file is machine-read by the Claude CLI, so no
+# indentation is needed
+_SETTINGS_JSON_BYTES = dumps(
+    {
+        "sandbox": {"enabled": False},  # No bash, so sandbox not needed
+        "permissions": {
+            "defaultMode": "bypassPermissions",  # Read-only, no dangerous ops
+            "allow": _PERMISSIONS_LIST,
+        },
+    }
+).encode()
+
+
+@dataclass(slots=True, frozen=True)
+class TextChunk:
+    """A streamed text chunk, yielded once per delta on the hot path.
+
+    Slotted and frozen so each instance is a single allocation with no
+    per-instance __dict__; control messages (tool calls, errors, done
+    markers) stay plain dicts since they are comparatively rare.
+    """
+    content: str
+
+
+# Spec excerpt length included in the system prompt
+_SPEC_TRUNCATE_LIMIT = 5000
+
+
+@lru_cache(maxsize=64)
+def _load_spec(path_str: str, mtime_ns: int) -> str:
+    """Read and truncate app_spec.txt, cached per (path, mtime).
+
+    The mtime key makes edits to the spec invalidate the entry naturally,
+    so a burst of session starts costs one disk read per spec version.
+
+    Reads at most the truncation limit (plus one byte to detect overflow)
+    rather than loading and decoding the whole file just to slice it.
+    """
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        raw = os.read(fd, _SPEC_TRUNCATE_LIMIT + 1)
+    finally:
+        os.close(fd)
+
+    truncated = len(raw) > _SPEC_TRUNCATE_LIMIT
+    # errors="replace" guards against cutting a multi-byte UTF-8 sequence
+    content = raw[:_SPEC_TRUNCATE_LIMIT].decode("utf-8", errors="replace")
+    if truncated:
+        content += "\n... (truncated)"
+    return content
+
 
 def get_system_prompt(project_name: str, project_dir: Path) -> str:
     """Generate the system prompt for the assistant with project context."""
@@ -71,15 +154,23 @@ def get_system_prompt(project_name: str, project_dir: Path) -> str:
     app_spec_content = ""
     from autoforge_paths import get_prompts_dir
     app_spec_path = get_prompts_dir(project_dir) / "app_spec.txt"
-    if app_spec_path.exists():
+    try:
+        # Single stat doubles as the existence check and the cache key
+        mtime_ns = os.stat(app_spec_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
         try:
-            app_spec_content = app_spec_path.read_text(encoding="utf-8")
-            # Truncate if too long
-            if len(app_spec_content) > 5000:
-                app_spec_content = app_spec_content[:5000] + "\n... (truncated)"
+            app_spec_content = _load_spec(str(app_spec_path), mtime_ns)
         except Exception as e:
             logger.warning(f"Failed to read app_spec.txt: {e}")
 
+    return _build_prompt(project_name, app_spec_content)
+
+
+@lru_cache(maxsize=64)
+def _build_prompt(project_name: str, app_spec_content: str) -> str:
+    """Assemble the full system prompt, cached per (project, spec excerpt)."""
     return f"""You are a helpful project assistant and backlog manager for the "{project_name}" project.
 
 Your role is to help users understand the codebase, answer questions about features, and manage the project backlog. You can READ files and CREATE/MANAGE features, but you cannot modify source code.
@@ -180,10 +271,19 @@ class AssistantChatSession:
         """
         self.project_name = project_name
         self.project_dir = project_dir
+        # Resolve once: start() needs the canonical path in three places
+        # (MCP env, cwd, settings), and resolving each use separately costs
+        # stat() syscalls and risks inconsistency if a symlink changes
+        try:
+            self._resolved_dir = str(project_dir.resolve())
+        except OSError:
+            self._resolved_dir = str(project_dir)
         self.conversation_id = conversation_id
         self.client: Optional[ClaudeSDKClient] = None
         self._client_entered: bool = False
-        self.created_at = datetime.now()
+        # Monotonic age marker; nothing formats this as a wall-clock time,
+        # so skip datetime.now()'s timezone lookup and object allocation
+        self.created_at = time.monotonic()
         self._history_loaded: bool = False  # Track if we've loaded history for resumed conversations
 
     async def close(self) -> None:
@@ -197,7 +297,7 @@ class AssistantChatSession:
                 self._client_entered = False
                 self.client = None
 
-    async def start(self) -> AsyncGenerator[dict, None]:
+    async def start(self) -> AsyncGenerator["TextChunk | dict", None]:
         """
         Initialize session with the Claude client.
 
@@ -210,33 +310,19 @@ class AssistantChatSession:
 
         # Create a new conversation if we don't have one
         if is_new_conversation:
-            conv = create_conversation(self.project_dir, self.project_name)
+            # Blocking SQLite/file work runs on the default thread pool so
+            # commits and fsyncs never stall other WebSocket sessions
+            conv = await asyncio.to_thread(create_conversation, self.project_dir, self.project_name)
             self.conversation_id = int(conv.id)  # type coercion: Column[int] -> int
             yield {"type": "conversation_created", "conversation_id": self.conversation_id}
 
-        # Build permissions list for assistant access (read + feature management)
-        permissions_list = [
-            "Read(./**)",
-            "Glob(./**)",
-            "Grep(./**)",
-            "WebFetch",
-            "WebSearch",
-            *ASSISTANT_FEATURE_TOOLS,
-        ]
-
-        # Create security settings file
-        security_settings = {
-            "sandbox": {"enabled": False},  # No bash, so sandbox not needed
-            "permissions": {
-                "defaultMode": "bypassPermissions",  # Read-only, no dangerous ops
-                "allow": permissions_list,
-            },
-        }
+        # Create security settings file from the pre-serialized constant
         from autoforge_paths import get_claude_assistant_settings_path
-        settings_file = get_claude_assistant_settings_path(self.project_dir)
+        # Built from the already-resolved dir so no further resolve() is
+        # needed when the path is handed to the SDK below
+        settings_file = get_claude_assistant_settings_path(Path(self._resolved_dir))
         settings_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(settings_file, "w") as f:
-            json.dump(security_settings, f, indent=2)
+        await asyncio.to_thread(write_bytes_if_changed, settings_file, _SETTINGS_JSON_BYTES)
 
         # Build MCP servers config - only features MCP for read-only access
         mcp_servers = {
@@ -246,8 +332,8 @@ class AssistantChatSession:
                 "env": {
                     # Only specify variables the MCP server needs
                     # (subprocess inherits parent environment automatically)
-                    "PROJECT_DIR": str(self.project_dir.resolve()),
-                    "PYTHONPATH": str(ROOT_DIR.resolve()),
+                    "PROJECT_DIR": self._resolved_dir,
+                    "PYTHONPATH": _ROOT_STR,
                 },
             },
         }
@@ -262,8 +348,8 @@ class AssistantChatSession:
             f.write(system_prompt)
         logger.info(f"Wrote assistant system prompt to {claude_md_path}")
 
-        # Use system Claude CLI
-        system_cli = shutil.which("claude")
+        # Use system Claude CLI (resolved at import)
+        system_cli = _SYSTEM_CLI
 
         # Build environment overrides for API configuration
         from registry import DEFAULT_MODEL, get_effective_sdk_env
@@ -281,13 +367,16 @@ class AssistantChatSession:
                     # System prompt loaded from CLAUDE.md via setting_sources
                     # This avoids Windows command line length limit (~8191 chars)
                     setting_sources=["project"],
-                    allowed_tools=[*READONLY_BUILTIN_TOOLS, *ASSISTANT_FEATURE_TOOLS],
+                    allowed_tools=list(_ALLOWED_TOOLS),
                     mcp_servers=mcp_servers,  # type: ignore[arg-type]  # SDK accepts dict config at runtime
                     permission_mode="bypassPermissions",
                     max_turns=100,
-                    cwd=str(self.project_dir.resolve()),
-                    settings=str(settings_file.resolve()),
+                    cwd=self._resolved_dir,
+                    settings=str(settings_file),
                     env=sdk_env,
+                    # Surface text deltas as StreamEvents so the UI renders
+                    # tokens as they arrive instead of whole blocks at once
+                    include_partial_messages=True,
                 )
             )
             logger.info("Entering Claude client context...")
@@ -310,9 +399,9 @@ class AssistantChatSession:
                 # Store the greeting in the database
                 # conversation_id is guaranteed non-None here (set on line 206 above)
                 assert self.conversation_id is not None
-                add_message(self.project_dir, self.conversation_id, "assistant", greeting)
+                await asyncio.to_thread(add_message, self.project_dir, self.conversation_id, "assistant", greeting)
 
-                yield {"type": "text", "content": greeting}
+                yield TextChunk(greeting)
                 yield {"type": "response_done"}
             except Exception as e:
                 logger.exception("Failed to send greeting")
@@ -322,7 +411,7 @@ class AssistantChatSession:
             # _history_loaded stays False so send_message() will include history
             yield {"type": "response_done"}
 
-    async def send_message(self, user_message: str) -> AsyncGenerator[dict, None]:
+    async def send_message(self, user_message: str) -> AsyncGenerator["TextChunk | dict", None]:
         """
         Send user message and stream Claude's response.
 
@@ -331,7 +420,7 @@ class AssistantChatSession:
 
         Yields:
             Message chunks:
-            - {"type": "text", "content": str}
+            - TextChunk(content=str) for streamed text
             - {"type": "tool_call", "tool": str, "input": dict}
             - {"type": "response_done"}
             - {"type": "error", "content": str}
@@ -344,16 +433,16 @@ class AssistantChatSession:
             yield {"type": "error", "content": "No conversation ID set."}
             return
 
-        # Store user message in database
-        add_message(self.project_dir, self.conversation_id, "user", user_message)
+        # Persist the user message before querying so it survives even if
+        # the client disconnects mid-stream or the SDK raises; only the
+        # assistant reply is written at the end of the turn.
+        await asyncio.to_thread(add_message, self.project_dir, self.conversation_id, "user", user_message)
 
         # For resumed conversations, include history context in first message
         message_to_send = user_message
         if not self._history_loaded:
             self._history_loaded = True
-            history = get_messages(self.project_dir, self.conversation_id)
-            # Exclude the message we just added (last one)
-            history = history[:-1] if history else []
+            history = await asyncio.to_thread(get_messages, self.project_dir, self.conversation_id)
             # Cap history to last 35 messages to prevent context overload
             history = history[-35:] if len(history) > 35 else history
             if history:
@@ -379,7 +468,7 @@ class AssistantChatSession:
             logger.exception("Error during Claude query")
             yield {"type": "error", "content": f"Error: {str(e)}"}
 
-    async def _query_claude(self, message: str) -> AsyncGenerator[dict, None]:
+    async def _query_claude(self, message: str) -> AsyncGenerator["TextChunk | dict", None]:
         """
         Internal method to query Claude and stream responses.
 
@@ -391,23 +480,45 @@ class AssistantChatSession:
         # Send message to Claude
         await self.client.query(message)
 
-        full_response = ""
+        # Accumulate chunks and join once; guaranteed O(N) regardless of
+        # whether the interpreter can apply the in-place str += trick
+        chunks: list[str] = []
 
-        # Stream the response
-        async for msg in self.client.receive_response():
-            msg_type = type(msg).__name__
+        # With include_partial_messages the SDK interleaves StreamEvents
+        # (raw API deltas) with the full AssistantMessages. Text already
+        # delivered as deltas must not be re-emitted when the complete
+        # message arrives, so track whether the current message streamed.
+        streamed_deltas = False
 
-            if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+        # Stream the response. isinstance is a C-level type check, cheaper
+        # per streamed chunk than type(...).__name__ string comparison
+        async for msg in self.client.receive_response():
+            if isinstance(msg, StreamEvent):
+                event = msg.event
+                if event.get("type") == "content_block_delta":
+                    delta = event.get("delta", {})
+                    if delta.get("type") == "text_delta":
+                        text = delta.get("text", "")
+                        if text:
+                            streamed_deltas = True
+                            chunks.append(text)
+                            yield TextChunk(text)
+                            # Give the WebSocket writer a scheduler pass so
+                            # bursts of deltas don't starve the send side
+                            await asyncio.sleep(0)
+
+            elif isinstance(msg, AssistantMessage):
                 for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "TextBlock" and hasattr(block, "text"):
+                    if isinstance(block, TextBlock):
+                        # Fallback for CLIs that don't emit stream events;
+                        # skipped when the text already went out as deltas
                         text = block.text
-                        if text:
-                            full_response += text
-                            yield {"type": "text", "content": text}
+                        if text and not streamed_deltas:
+                            chunks.append(text)
+                            yield TextChunk(text)
+                            await asyncio.sleep(0)
 
-                    elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                    elif isinstance(block, ToolUseBlock):
                         tool_name = block.name
                         tool_input = getattr(block, "input", {})
 
@@ -419,6 +530,7 @@ class AssistantChatSession:
                                     "type": "question",
                                     "questions": questions,
                                 }
+                                await asyncio.sleep(0)
                                 continue
 
                         yield {
@@ -426,25 +538,54 @@ class AssistantChatSession:
                             "tool": tool_name,
                             "input": tool_input,
                         }
+                        await asyncio.sleep(0)
 
-        # Store the complete response in the database
-        if full_response and self.conversation_id:
-            add_message(self.project_dir, self.conversation_id, "assistant", full_response)
+                # Next assistant message (e.g. after a tool result) streams
+                # its own deltas
+                streamed_deltas = False
+
+        # Store the assistant reply (the user message was persisted up
+        # front in send_message)
+        if self.conversation_id and chunks:
+            await asyncio.to_thread(
+                add_message, self.project_dir, self.conversation_id, "assistant", "".join(chunks)
+            )
 
     def get_conversation_id(self) -> Optional[int]:
         """Get the current conversation ID."""
         return self.conversation_id
 
 
-# Session registry with thread safety
-_sessions: dict[str, AssistantChatSession] = {}
-_sessions_lock = threading.Lock()
+# Session registry. Mutations happen on the event loop under an asyncio
+# lock so they never block the loop; sync readers rely on CPython dict
+# atomicity for single-key get and keys() snapshots.
+#
+# Ordered so the registry can evict least-recently-used sessions: each
+# session holds a live Claude CLI subprocess, so an unbounded registry
+# leaks processes and file descriptors on servers touching many projects.
+_sessions: OrderedDict[str, AssistantChatSession] = OrderedDict()
+_sessions_lock = asyncio.Lock()
+
+# Cap on concurrently live sessions (each one is a CLI subprocess)
+_MAX_ACTIVE_SESSIONS = int(os.getenv("AUTOFORGE_MAX_SESSIONS", "16"))
 
 
 def get_session(project_name: str) -> Optional[AssistantChatSession]:
     """Get an existing session for a project."""
-    with _sessions_lock:
-        return _sessions.get(project_name)
+    session = _sessions.get(project_name)
+    if session is not None:
+        # Refresh LRU position; safe without the lock because all registry
+        # mutations happen on the event loop thread
+        _sessions.move_to_end(project_name)
+    return session
+
+
+async def _safe_close(session: AssistantChatSession) -> None:
+    """Close a session, logging instead of raising on failure."""
+    try:
+        await session.close()
+    except Exception as e:
+        logger.warning(f"Error closing session for {session.project_name}: {e}")
 
 
 async def create_session(
@@ -460,18 +601,23 @@ async def create_session(
         project_dir: Absolute path to the project directory
         conversation_id: Optional conversation ID to resume
     """
-    old_session: Optional[AssistantChatSession] = None
+    to_close: list[AssistantChatSession] = []
 
-    with _sessions_lock:
+    async with _sessions_lock:
         old_session = _sessions.pop(project_name, None)
+        if old_session:
+            to_close.append(old_session)
         session = AssistantChatSession(project_name, project_dir, conversation_id)
         _sessions[project_name] = session
+        # Evict least-recently-used sessions beyond the cap so long-running
+        # servers don't accumulate idle CLI subprocesses
+        while len(_sessions) > _MAX_ACTIVE_SESSIONS:
+            evicted_name, evicted = _sessions.popitem(last=False)
+            logger.info(f"Evicting least-recently-used assistant session for {evicted_name}")
+            to_close.append(evicted)
 
-    if old_session:
-        try:
-            await old_session.close()
-        except Exception as e:
-            logger.warning(f"Error closing old session for {project_name}: {e}")
+    if to_close:
+        await asyncio.gather(*(_safe_close(s) for s in to_close))
 
     return session
 
@@ -480,32 +626,27 @@ async def remove_session(project_name: str) -> None:
     """Remove and close a session."""
     session: Optional[AssistantChatSession] = None
 
-    with _sessions_lock:
+    async with _sessions_lock:
         session = _sessions.pop(project_name, None)
 
     if session:
-        try:
-            await session.close()
-        except Exception as e:
-            logger.warning(f"Error closing session for {project_name}: {e}")
+        await _safe_close(session)
 
 
 def list_sessions() -> list[str]:
     """List all active session project names."""
-    with _sessions_lock:
-        return list(_sessions.keys())
+    return list(_sessions.keys())
 
 
 async def cleanup_all_sessions() -> None:
     """Close all active sessions. Called on server shutdown."""
     sessions_to_close: list[AssistantChatSession] = []
 
-    with _sessions_lock:
+    async with _sessions_lock:
         sessions_to_close = list(_sessions.values())
         _sessions.clear()
 
-    for session in sessions_to_close:
-        try:
-            await session.close()
-        except Exception as e:
-            logger.warning(f"Error closing session {session.project_name}: {e}")
+    if sessions_to_close:
+        # Close concurrently: teardown is dominated by subprocess reaping,
+        # so shutdown takes ~one close latency instead of one per session
+        await asyncio.gather(*(_safe_close(s) for s in sessions_to_close))
@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, create_engine, func
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, create_engine, event, func
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, relationship, sessionmaker
 
@@ -26,6 +26,10 @@ class Base(DeclarativeBase):
 # Key: project directory path (as posix string), Value: SQLAlchemy engine
 _engine_cache: dict[str, Engine] = {}
 
+# Session factory cache, keyed like the engine cache. sessionmaker() does
+# configuration work at construction time, so build it once per engine.
+_sessionmaker_cache: dict[str, sessionmaker] = {}
+
 # Lock for thread-safe access to the engine cache
 # Prevents race conditions when multiple threads create engines simultaneously
 _cache_lock = threading.Lock()
@@ -62,6 +66,22 @@ class ConversationMessage(Base):
     conversation = relationship("Conversation", back_populates="messages")
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure each new SQLite connection for concurrent chat workloads.
+
+    WAL lets readers proceed during writes, synchronous=NORMAL drops the
+    per-commit fsync that FULL pays (safe with WAL), and the memory
+    settings keep temp structures and hot pages off disk. Set once per
+    connection instead of being re-negotiated on every operation.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-8000")
+    cursor.close()
+
+
 def get_db_path(project_dir: Path) -> Path:
     """Get the path to the assistant database for a project."""
     from autoforge_paths import get_assistant_db_path
@@ -97,8 +117,10 @@ def get_engine(project_dir: Path):
                     "timeout": 30,  # Wait up to 30s for locks
                 }
             )
+            event.listen(engine, "connect", _set_sqlite_pragmas)
             Base.metadata.create_all(engine)
             _engine_cache[cache_key] = engine
+            _sessionmaker_cache[cache_key] = sessionmaker(bind=engine)
             logger.debug(f"Created new database engine for {cache_key}")
 
     return _engine_cache[cache_key]
@@ -117,6 +139,7 @@ def dispose_engine(project_dir: Path) -> bool:
 
     if cache_key in _engine_cache:
         engine = _engine_cache.pop(cache_key)
+        _sessionmaker_cache.pop(cache_key, None)
         engine.dispose()
         logger.debug(f"Disposed database engine for {cache_key}")
         return True
@@ -126,9 +149,12 @@ def dispose_engine(project_dir: Path) -> bool:
 
 def get_session(project_dir: Path):
     """Get a new database session for a project."""
-    engine = get_engine(project_dir)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    cache_key = project_dir.as_posix()
+    factory = _sessionmaker_cache.get(cache_key)
+    if factory is None:
+        get_engine(project_dir)
+        factory = _sessionmaker_cache[cache_key]
+    return factory()
 
 
 # ============================================================================
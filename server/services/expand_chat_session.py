@@ -7,14 +7,15 @@ Uses the expand-project.md skill to help users add features to existing projects
 """
 
 import asyncio
-import json
 import logging
 import os
 import shutil
 import sys
 import threading
-import uuid
+import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, AsyncGenerator, Optional
 
@@ -22,6 +23,8 @@ from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from dotenv import load_dotenv
 
 from ..schemas import ImageAttachment
+from ..utils.file_utils import write_bytes_if_changed
+from ..utils.json_utils import dumps
 from .chat_constants import ROOT_DIR, make_multimodal_message
 
 # Load environment variables from .env file if present
@@ -37,6 +40,48 @@ EXPAND_FEATURE_TOOLS = [
 ]
 
 
+# Security settings file content, pre-serialized once. Compact output --
+# the file is machine-read by the Claude CLI.
+# Note: permission_mode="bypassPermissions" is safe here because:
+# 1. Only Read/Glob file tools are allowed (no Write/Edit)
+# 2. MCP tools are restricted to feature creation only
+# 3. No Bash access - cannot execute arbitrary commands
+_SETTINGS_JSON_BYTES = dumps(
+    {
+        "sandbox": {"enabled": True},
+        "permissions": {
+            "defaultMode": "bypassPermissions",
+            "allow": [
+                "Read(./**)",
+                "Glob(./**)",
+                *EXPAND_FEATURE_TOOLS,
+            ],
+        },
+    }
+).encode()
+
+
+@lru_cache(maxsize=8)
+def _load_skill(path_str: str, mtime_ns: int) -> str:
+    """Read the expand-project skill, cached per (path, mtime).
+
+    The skill file rarely changes, so repeated session starts reuse the
+    decoded text; an edit bumps the mtime and invalidates naturally.
+    """
+    return Path(path_str).read_text(encoding="utf-8", errors="replace")
+
+
+@lru_cache(maxsize=32)
+def _build_system_prompt(path_str: str, mtime_ns: int, project_path: str) -> str:
+    """Substitute the project path into the skill, cached per project.
+
+    The $ARGUMENTS replacement scans a multi-KB string; memoizing on the
+    skill version and project path makes repeat session starts reuse the
+    finished prompt.
+    """
+    return _load_skill(path_str, mtime_ns).replace("$ARGUMENTS", project_path)
+
+
 class ExpandChatSession:
     """
     Manages a project expansion conversation.
@@ -47,6 +92,22 @@ class ExpandChatSession:
     3. Claude creates features via the feature_create_bulk MCP tool
     """
 
+    # Fixed attribute set: skips the per-instance __dict__ and makes
+    # self.* loads a direct offset read on the streaming path
+    __slots__ = (
+        "project_name",
+        "project_dir",
+        "client",
+        "messages",
+        "complete",
+        "created_at",
+        "_conversation_id",
+        "_client_entered",
+        "features_created",
+        "created_feature_ids",
+        "_busy",
+    )
+
     def __init__(self, project_name: str, project_dir: Path):
         """
         Initialize the session.
@@ -58,15 +119,19 @@ class ExpandChatSession:
         self.project_name = project_name
         self.project_dir = project_dir
         self.client: Optional[ClaudeSDKClient] = None
-        self.messages: list[dict] = []
+        # Bounded ring buffer: caps memory for marathon sessions and keeps
+        # the get_messages copy O(maxlen) instead of O(turns)
+        self.messages: deque[dict] = deque(maxlen=1000)
         self.complete: bool = False
         self.created_at = datetime.now()
         self._conversation_id: Optional[str] = None
         self._client_entered: bool = False
         self.features_created: int = 0
         self.created_feature_ids: list[int] = []
-        self._settings_file: Optional[Path] = None
-        self._query_lock = asyncio.Lock()
+        # Single-flight guard: concurrent queries are rejected, not queued
+        # (the SDK can't interleave turns anyway), so a plain bool beats an
+        # asyncio.Lock and its waiter bookkeeping
+        self._busy = False
 
     async def close(self) -> None:
         """Clean up resources and close the Claude client."""
@@ -79,13 +144,6 @@ class ExpandChatSession:
                 self._client_entered = False
                 self.client = None
 
-        # Clean up temporary settings file
-        if self._settings_file and self._settings_file.exists():
-            try:
-                self._settings_file.unlink()
-            except Exception as e:
-                logger.warning(f"Error removing settings file: {e}")
-
     async def start(self) -> AsyncGenerator[dict, None]:
         """
         Initialize session and get initial greeting from Claude.
@@ -95,7 +153,10 @@ class ExpandChatSession:
         # Load the expand-project skill
         skill_path = ROOT_DIR / ".claude" / "commands" / "expand-project.md"
 
-        if not skill_path.exists():
+        try:
+            # Single stat doubles as the existence check and the cache key
+            skill_mtime_ns = os.stat(skill_path).st_mtime_ns
+        except OSError:
             yield {
                 "type": "error",
                 "content": f"Expand project skill not found at {skill_path}"
@@ -112,11 +173,6 @@ class ExpandChatSession:
             }
             return
 
-        try:
-            skill_content = skill_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            skill_content = skill_path.read_text(encoding="utf-8", errors="replace")
-
         # Find and validate Claude CLI before creating temp files
         system_cli = shutil.which("claude")
         if not system_cli:
@@ -126,32 +182,17 @@ class ExpandChatSession:
             }
             return
 
-        # Create temporary security settings file (unique per session to avoid conflicts)
-        # Note: permission_mode="bypassPermissions" is safe here because:
-        # 1. Only Read/Glob file tools are allowed (no Write/Edit)
-        # 2. MCP tools are restricted to feature creation only
-        # 3. No Bash access - cannot execute arbitrary commands
-        security_settings = {
-            "sandbox": {"enabled": True},
-            "permissions": {
-                "defaultMode": "bypassPermissions",
-                "allow": [
-                    "Read(./**)",
-                    "Glob(./**)",
-                    *EXPAND_FEATURE_TOOLS,
-                ],
-            },
-        }
+        # Write the shared security settings file from the pre-serialized
+        # constant (one file per project, reused across sessions)
         from autoforge_paths import get_expand_settings_path
-        settings_file = get_expand_settings_path(self.project_dir, uuid.uuid4().hex)
+        settings_file = get_expand_settings_path(self.project_dir)
         settings_file.parent.mkdir(parents=True, exist_ok=True)
-        self._settings_file = settings_file
-        with open(settings_file, "w", encoding="utf-8") as f:
-            json.dump(security_settings, f, indent=2)
+        # Off the loop: the write (when needed) can block on fsync
+        await asyncio.to_thread(write_bytes_if_changed, settings_file, _SETTINGS_JSON_BYTES)
 
         # Replace $ARGUMENTS with absolute project path
         project_path = str(self.project_dir.resolve())
-        system_prompt = skill_content.replace("$ARGUMENTS", project_path)
+        system_prompt = _build_system_prompt(str(skill_path), skill_mtime_ns, project_path)
 
         # Build environment overrides for API configuration
         from registry import DEFAULT_MODEL, get_effective_sdk_env
@@ -206,10 +247,13 @@ class ExpandChatSession:
             return
 
         # Start the conversation
+        if self._busy:
+            yield {"type": "error", "content": "A response is already in progress"}
+            return
+        self._busy = True
         try:
-            async with self._query_lock:
-                async for chunk in self._query_claude("Begin the project expansion process."):
-                    yield chunk
+            async for chunk in self._query_claude("Begin the project expansion process."):
+                yield chunk
             yield {"type": "response_done"}
         except Exception:
             logger.exception("Failed to start expand chat")
@@ -217,6 +261,8 @@ class ExpandChatSession:
                 "type": "error",
                 "content": "Failed to start conversation"
             }
+        finally:
+            self._busy = False
 
     async def send_message(
         self,
@@ -244,19 +290,26 @@ class ExpandChatSession:
             }
             return
 
+        # Reject concurrent queries so they can't corrupt the response stream.
+        # Checked before recording the message so a rejected send leaves no
+        # orphan entry in the history.
+        if self._busy:
+            yield {"type": "error", "content": "A response is already in progress"}
+            return
+        self._busy = True
+
         # Store the user message
         self.messages.append({
             "role": "user",
             "content": user_message,
             "has_attachments": bool(attachments),
-            "timestamp": datetime.now().isoformat()
+            # Integer nanoseconds: no consumer reads these as wall-clock
+            # strings, so skip the datetime allocation + ISO formatting
+            "timestamp": time.time_ns()
         })
-
         try:
-            # Use lock to prevent concurrent queries from corrupting the response stream
-            async with self._query_lock:
-                async for chunk in self._query_claude(user_message, attachments):
-                    yield chunk
+            async for chunk in self._query_claude(user_message, attachments):
+                yield chunk
             yield {"type": "response_done"}
         except Exception:
             logger.exception("Error during Claude query")
@@ -264,6 +317,8 @@ class ExpandChatSession:
                 "type": "error",
                 "content": "Error while processing message"
             }
+        finally:
+            self._busy = False
 
     async def _query_claude(
         self,
@@ -298,7 +353,10 @@ class ExpandChatSession:
         else:
             await self.client.query(message)
 
-        # Stream the response
+        # Stream the response. Text blocks go out as they arrive; history
+        # is accumulated and recorded once per turn instead of paying a
+        # dict + datetime.isoformat per block
+        turn_text: list[str] = []
         async for msg in self.client.receive_response():
             msg_type = type(msg).__name__
 
@@ -310,12 +368,14 @@ class ExpandChatSession:
                         text = block.text
                         if text:
                             yield {"type": "text", "content": text}
+                            turn_text.append(text)
 
-                            self.messages.append({
-                                "role": "assistant",
-                                "content": text,
-                                "timestamp": datetime.now().isoformat()
-                            })
+        if turn_text:
+            self.messages.append({
+                "role": "assistant",
+                "content": "".join(turn_text),
+                "timestamp": time.time_ns()
+            })
 
     def get_features_created(self) -> int:
         """Get the total number of features created in this session."""
@@ -327,18 +387,19 @@ class ExpandChatSession:
 
     def get_messages(self) -> list[dict]:
         """Get all messages in the conversation."""
-        return self.messages.copy()
+        return list(self.messages)
 
 
-# Session registry with thread safety
+# Session registry. Mutations take the lock; pure reads rely on CPython
+# dict atomicity for single-key get and keys() snapshots, so lookups on
+# the request path never contend with session creation/teardown.
 _expand_sessions: dict[str, ExpandChatSession] = {}
 _expand_sessions_lock = threading.Lock()
 
 
 def get_expand_session(project_name: str) -> Optional[ExpandChatSession]:
     """Get an existing expansion session for a project."""
-    with _expand_sessions_lock:
-        return _expand_sessions.get(project_name)
+    return _expand_sessions.get(project_name)
 
 
 async def create_expand_session(project_name: str, project_dir: Path) -> ExpandChatSession:
@@ -375,8 +436,7 @@ async def remove_expand_session(project_name: str) -> None:
 
 def list_expand_sessions() -> list[str]:
     """List all active expansion session project names."""
-    with _expand_sessions_lock:
-        return list(_expand_sessions.keys())
+    return list(_expand_sessions)
 
 
 async def cleanup_all_expand_sessions() -> None:
@@ -7,27 +7,38 @@ Uses winpty (ConPTY) on Windows and built-in pty module on Unix.
 """
 
 import asyncio
+import itertools
 import logging
 import os
 import platform
 import shutil
+import stat
 import threading
-import uuid
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Callable, Set
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class TerminalInfo:
-    """Metadata for a terminal instance."""
+    """Metadata for a terminal instance.
+
+    ``created_at`` is a ``time.time_ns`` integer; ISO formatting is done
+    lazily via :meth:`created_at_iso` only when the value is serialized.
+    """
 
     id: str
     name: str
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: int = field(default_factory=time.time_ns)
+
+    def created_at_iso(self) -> str:
+        """Format the creation time as an ISO-8601 string."""
+        return datetime.fromtimestamp(self.created_at / 1e9).isoformat()
 
 
 # Platform detection
@@ -52,7 +63,6 @@ else:
     # Unix systems use built-in pty module
     import fcntl
     import pty
-    import select
     import signal
     import struct
     import termios
@@ -60,10 +70,15 @@ else:
     WINPTY_AVAILABLE = False  # Not applicable on Unix
 
 
+@cache
 def _get_shell() -> str:
     """
     Get the appropriate shell for the current platform.
 
+    The result is cached for the life of the process: the PATH and $SHELL
+    lookups cost several filesystem syscalls and never change for a running
+    server. Tests can reset via ``_get_shell.cache_clear()``.
+
     Returns:
         Path to shell executable
     """
@@ -89,6 +104,17 @@ def _get_shell() -> str:
         return "/bin/sh"
 
 
+@lru_cache(maxsize=256)
+def _resolved_dir(project_dir: Path) -> str:
+    """Resolve *project_dir* once per server run.
+
+    ``Path.resolve`` walks the filesystem for symlinks on every call;
+    project locations don't move while the server runs, so repeat terminal
+    starts in the same project reuse the cached answer.
+    """
+    return str(project_dir.resolve())
+
+
 class TerminalSession:
     """
     Manages a single PTY terminal session for a project.
@@ -110,15 +136,38 @@ class TerminalSession:
 
         # PTY process references (platform-specific)
         self._pty_process: "WinPtyProcess | None" = None  # Windows winpty
+        # Whether winpty.write accepts bytes (newer pywinpty) or only str;
+        # probed on the first write and remembered
+        self._winpty_accepts_bytes: bool | None = None
         self._master_fd: int | None = None  # Unix master file descriptor
         self._child_pid: int | None = None  # Unix child process PID
 
         # State tracking
         self._is_active = False
-        self._output_task: asyncio.Task | None = None
-
-        # Output callbacks with thread-safe access
-        self._output_callbacks: Set[Callable[[bytes], None]] = set()
+        self._reader_thread: threading.Thread | None = None  # Windows pump thread
+        self._loop: asyncio.AbstractEventLoop | None = None  # Event loop for cross-thread posts
+
+        # Lifecycle events so WebSocket handlers can await start/stop
+        # transitions instead of polling is_active
+        self.started_event = asyncio.Event()
+        self.stopped_event = asyncio.Event()
+
+        # Non-blocking write queue (Unix): input the PTY won't accept yet
+        # waits here until the fd signals writable
+        self._write_buf = bytearray()
+        self._write_waiting = False
+
+        # Output batcher: chunks accumulate briefly so bursty output goes
+        # out as a few large frames instead of many tiny ones
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # Output callbacks as a copy-on-write tuple: the PTY reader iterates
+        # it lock-free on every output chunk (attribute loads are atomic in
+        # CPython); writers rebuild a fresh tuple under the lock on the cold
+        # connect/disconnect path
+        self._output_callbacks: tuple[Callable[[bytes], None], ...] = ()
         self._callbacks_lock = threading.Lock()
 
     @property
@@ -126,6 +175,18 @@ class TerminalSession:
         """Check if the terminal session is currently active."""
         return self._is_active
 
+    def _mark_started(self) -> None:
+        """Record the session as active and wake started_event waiters."""
+        self._is_active = True
+        self.stopped_event.clear()
+        self.started_event.set()
+
+    def _mark_stopped(self) -> None:
+        """Record the session as inactive and wake stopped_event waiters."""
+        self._is_active = False
+        self.started_event.clear()
+        self.stopped_event.set()
+
     @property
     def pid(self) -> int | None:
         """Get the PID of the PTY child process."""
@@ -148,7 +209,8 @@ class TerminalSession:
             callback: Function that receives raw bytes from the PTY
         """
         with self._callbacks_lock:
-            self._output_callbacks.add(callback)
+            if callback not in self._output_callbacks:
+                self._output_callbacks = self._output_callbacks + (callback,)
 
     def remove_output_callback(self, callback: Callable[[bytes], None]) -> None:
         """
@@ -158,19 +220,66 @@ class TerminalSession:
             callback: The callback to remove
         """
         with self._callbacks_lock:
-            self._output_callbacks.discard(callback)
+            self._output_callbacks = tuple(
+                cb for cb in self._output_callbacks if cb is not callback
+            )
 
-    def _broadcast_output(self, data: bytes) -> None:
-        """Broadcast output data to all registered callbacks."""
+    def remove_output_callback_and_count(self, callback: Callable[[bytes], None]) -> int:
+        """
+        Remove an output callback and return how many remain.
+
+        Single lock hold, so disconnect handlers can decide whether they
+        were the last client without reaching into session internals.
+
+        Args:
+            callback: The callback to remove
+
+        Returns:
+            Number of callbacks still registered after removal
+        """
         with self._callbacks_lock:
-            callbacks = list(self._output_callbacks)
+            self._output_callbacks = tuple(
+                cb for cb in self._output_callbacks if cb is not callback
+            )
+            return len(self._output_callbacks)
 
-        for callback in callbacks:
+    def _broadcast_output(self, data: bytes) -> None:
+        """Broadcast output data to all registered callbacks.
+
+        Runs on every PTY read; the copy-on-write tuple makes this
+        lock-free on the hot path.
+        """
+        for callback in self._output_callbacks:
             try:
                 callback(data)
             except Exception as e:
                 logger.warning(f"Output callback error: {e}")
 
+    def _queue_output(self, data: bytes) -> None:
+        """Queue an output chunk, coalescing bursts before broadcast.
+
+        Chunks are held for at most 3 ms or 64 KiB, whichever comes first,
+        so sustained output reaches clients as a few large frames instead
+        of one WebSocket frame per read. Must run on the loop thread.
+        """
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= 65536:
+            self._flush_output()
+        elif self._flush_handle is None and self._loop is not None:
+            self._flush_handle = self._loop.call_later(0.003, self._flush_output)
+
+    def _flush_output(self) -> None:
+        """Broadcast any queued output and clear the flush timer."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending:
+            data = self._pending[0] if len(self._pending) == 1 else b"".join(self._pending)
+            self._pending.clear()
+            self._pending_size = 0
+            self._broadcast_output(data)
+
     async def start(self, cols: int = 80, rows: int = 24) -> bool:
         """
         Start the PTY terminal session.
@@ -186,16 +295,19 @@ class TerminalSession:
             logger.warning(f"Terminal session already active for {self.project_name}")
             return False
 
-        # Validate project directory
-        if not self.project_dir.exists():
+        # Validate project directory: one stat covers both the existence
+        # and the is-directory check
+        try:
+            st = os.stat(self.project_dir)
+        except OSError:
             logger.error(f"Project directory does not exist: {self.project_dir}")
             return False
-        if not self.project_dir.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             logger.error(f"Project path is not a directory: {self.project_dir}")
             return False
 
         shell = _get_shell()
-        cwd = str(self.project_dir.resolve())
+        cwd = _resolved_dir(self.project_dir)
 
         try:
             if IS_WINDOWS:
@@ -222,10 +334,18 @@ class TerminalSession:
                 cwd=cwd,
                 dimensions=(rows, cols),
             )
-            self._is_active = True
-
-            # Start output reading task
-            self._output_task = asyncio.create_task(self._read_output_windows())
+            self._mark_started()
+
+            # Dedicated pump thread per terminal: winpty reads are blocking,
+            # and parking them in the shared default executor both queues
+            # behind unrelated work and pins a pool worker per terminal
+            self._loop = asyncio.get_running_loop()
+            self._reader_thread = threading.Thread(
+                target=self._winpty_pump,
+                name=f"winpty-pump-{self.project_name}",
+                daemon=True,
+            )
+            self._reader_thread.start()
 
             logger.info(f"Terminal started for {self.project_name} (PID: {self.pid}, shell: {shell})")
             return True
@@ -236,38 +356,32 @@ class TerminalSession:
             return False
 
     async def _start_unix(self, shell: str, cwd: str, cols: int, rows: int) -> bool:
-        """Start PTY on Unix using built-in pty module."""
+        """Start PTY on Unix using posix_spawn (with a pty.fork fallback)."""
         # Note: This entire method uses Unix-specific APIs that don't exist on Windows.
         # Type checking is disabled for these platform-specific calls.
         try:
-            # Fork a new pseudo-terminal
-            pid, master_fd = pty.fork()  # type: ignore[attr-defined]
-
-            if pid == 0:
-                # Child process - exec the shell
-                os.chdir(cwd)
-                # Set terminal size (Unix-specific modules imported at top-level)
-                winsize = struct.pack("HHHH", rows, cols, 0, 0)
-                fcntl.ioctl(0, termios.TIOCSWINSZ, winsize)  # type: ignore[attr-defined]
-
-                # Execute the shell
-                os.execvp(shell, [shell])
-                os._exit(1)  # Fallback if execvp returns (shouldn't happen)
-            else:
-                # Parent process
-                self._master_fd = master_fd
-                self._child_pid = pid
-                self._is_active = True
-
-                # Set terminal size on master (Unix-specific modules imported at top-level)
-                winsize = struct.pack("HHHH", rows, cols, 0, 0)
-                fcntl.ioctl(master_fd, termios.TIOCSWINSZ, winsize)  # type: ignore[attr-defined]
-
-                # Start output reading task
-                self._output_task = asyncio.create_task(self._read_output_unix())
-
-                logger.info(f"Terminal started for {self.project_name} (PID: {pid}, shell: {shell})")
-                return True
+            try:
+                pid, master_fd = self._spawn_unix(shell, cwd, cols, rows)
+            except (OSError, NotImplementedError) as e:
+                # posix_spawn setsid/file-action support varies by libc;
+                # fall back to the classic fork+exec path
+                logger.warning(f"posix_spawn PTY start failed ({e}), falling back to pty.fork")
+                pid, master_fd = self._spawn_unix_fork(shell, cwd, cols, rows)
+                if pid == 0:
+                    return False  # Unreachable: child never returns
+
+            self._master_fd = master_fd
+            self._child_pid = pid
+            self._mark_started()
+
+            # Event-driven reads on the loop itself: no reader thread,
+            # no select() polling, zero wakeups while the shell is idle
+            os.set_blocking(master_fd, False)
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(master_fd, self._on_pty_readable)
+
+            logger.info(f"Terminal started for {self.project_name} (PID: {pid}, shell: {shell})")
+            return True
 
         except Exception as e:
             logger.exception(f"Failed to start Unix PTY: {e}")
@@ -275,119 +389,190 @@ class TerminalSession:
             self._child_pid = None
             return False
 
-    async def _read_output_windows(self) -> None:
-        """Read output from Windows PTY and broadcast to callbacks."""
-        pty = self._pty_process
-        if pty is None:
-            return
+    @staticmethod
+    def _spawn_unix(shell: str, cwd: str, cols: int, rows: int) -> tuple[int, int]:
+        """Spawn the shell on a fresh PTY pair via os.posix_spawn.
 
-        loop = asyncio.get_running_loop()
+        posix_spawn uses vfork+exec on glibc, so the (large) server process
+        never pays the fork page-table copy. The child becomes a session
+        leader (``setsid=True``) and then *opens* the slave device as fd 0:
+        the first tty a session leader opens becomes its controlling
+        terminal, which is what job control and Ctrl-C delivery need.
+        posix_spawn has no chdir file action, so a tiny ``sh -c`` trampoline
+        changes directory and execs the real shell; the cwd and shell travel
+        as env vars to avoid quoting.
 
-        def read_data():
-            """Read data from PTY, capturing pty reference to avoid race condition."""
-            try:
-                if pty.isalive():
-                    return pty.read(4096)
-            except Exception:
-                pass
-            return b""
+        Returns:
+            ``(pid, master_fd)`` on success.
 
+        Raises:
+            OSError: If the spawn fails (caller falls back to pty.fork).
+        """
+        master_fd, slave_fd = pty.openpty()  # type: ignore[attr-defined]
         try:
-            while self._is_active and self._pty_process is not None:
-                try:
-                    # Use run_in_executor for non-blocking read
-                    # winpty read() is blocking, so we need to run it in executor
-                    data = await loop.run_in_executor(None, read_data)
-
-                    if data:
-                        # winpty may return string, convert to bytes if needed
-                        if isinstance(data, str):
-                            data = data.encode("utf-8", errors="replace")
-                        self._broadcast_output(data)
-                    else:
-                        # Check if process is still alive
-                        if self._pty_process is None or not self._pty_process.isalive():
-                            break
-                        # Small delay to prevent busy loop
-                        await asyncio.sleep(0.01)
-
-                except asyncio.CancelledError:
-                    raise
-                except Exception as e:
-                    if self._is_active:
-                        logger.warning(f"Windows PTY read error: {e}")
-                    break
-
-        except asyncio.CancelledError:
-            pass
+            winsize = struct.pack("HHHH", rows, cols, 0, 0)
+            fcntl.ioctl(slave_fd, termios.TIOCSWINSZ, winsize)  # type: ignore[attr-defined]
+            slave_path = os.ttyname(slave_fd)
+            env = dict(os.environ, _AUTOFORGE_TTY_CWD=cwd, _AUTOFORGE_TTY_SHELL=shell)
+            file_actions = [
+                (os.POSIX_SPAWN_OPEN, 0, slave_path, os.O_RDWR, 0),
+                (os.POSIX_SPAWN_DUP2, 0, 1),
+                (os.POSIX_SPAWN_DUP2, 0, 2),
+                (os.POSIX_SPAWN_CLOSE, slave_fd),
+                (os.POSIX_SPAWN_CLOSE, master_fd),
+            ]
+            pid = os.posix_spawn(
+                "/bin/sh",
+                # Capture the trampoline variables into locals and unset them
+                # so they do not leak into the spawned shell's environment.
+                [
+                    "/bin/sh",
+                    "-c",
+                    'd="$_AUTOFORGE_TTY_CWD" s="$_AUTOFORGE_TTY_SHELL"'
+                    " && unset _AUTOFORGE_TTY_CWD _AUTOFORGE_TTY_SHELL"
+                    ' && cd "$d" && exec "$s"',
+                ],
+                env,
+                file_actions=file_actions,
+                setsid=True,
+            )
+        except BaseException:
+            os.close(master_fd)
+            raise
         finally:
-            if self._is_active:
-                self._is_active = False
-                logger.info(f"Terminal output stream ended for {self.project_name}")
+            os.close(slave_fd)
+        return pid, master_fd
 
-    async def _read_output_unix(self) -> None:
-        """Read output from Unix PTY and broadcast to callbacks."""
-        if self._master_fd is None:
-            return
+    @staticmethod
+    def _spawn_unix_fork(shell: str, cwd: str, cols: int, rows: int) -> tuple[int, int]:
+        """Legacy fork+exec PTY spawn, kept as a posix_spawn fallback.
 
-        loop = asyncio.get_running_loop()
+        Returns:
+            ``(pid, master_fd)`` in the parent; the child never returns.
+        """
+        pid, master_fd = pty.fork()  # type: ignore[attr-defined]
+
+        if pid == 0:
+            # Child process - exec the shell
+            os.chdir(cwd)
+            # Set terminal size (Unix-specific modules imported at top-level)
+            winsize = struct.pack("HHHH", rows, cols, 0, 0)
+            fcntl.ioctl(0, termios.TIOCSWINSZ, winsize)  # type: ignore[attr-defined]
+
+            # Execute the shell
+            os.execvp(shell, [shell])
+            os._exit(1)  # Fallback if execvp returns (shouldn't happen)
+
+        # Parent: size the master side too (the child already sized the slave)
+        winsize = struct.pack("HHHH", rows, cols, 0, 0)
+        fcntl.ioctl(master_fd, termios.TIOCSWINSZ, winsize)  # type: ignore[attr-defined]
+        return pid, master_fd
+
+    def _winpty_pump(self) -> None:
+        """Pump Windows PTY output to callbacks from a dedicated thread.
+
+        Blocking ``pty.read`` calls live entirely on this thread; each chunk
+        is posted to the event loop with ``call_soon_threadsafe``, so the
+        loop only ever runs the (cheap) broadcast. Closing the PTY on stop
+        unblocks the read and lets the thread exit.
+        """
+        pty = self._pty_process
+        loop = self._loop
+        if pty is None or loop is None:
+            return
 
         try:
-            while self._is_active and self._master_fd is not None:
+            while self._is_active and self._pty_process is not None:
                 try:
-                    # Use run_in_executor with select for non-blocking read
-                    def read_with_select():
-                        if self._master_fd is None:
-                            return b""
-                        try:
-                            # Wait up to 100ms for data
-                            readable, _, _ = select.select([self._master_fd], [], [], 0.1)
-                            if readable:
-                                return os.read(self._master_fd, 4096)
-                            return b""
-                        except (OSError, ValueError):
-                            return b""
-
-                    data = await loop.run_in_executor(None, read_with_select)
-
-                    if data:
-                        self._broadcast_output(data)
-                    elif not self._check_child_alive():
+                    if not pty.isalive():
                         break
-
-                except asyncio.CancelledError:
-                    raise
+                    # 64 KiB per read: bulk output (e.g. cat of a large
+                    # file) needs 16x fewer wakeups than 4 KiB
+                    data = pty.read(65536)
                 except Exception as e:
                     if self._is_active:
-                        logger.warning(f"Unix PTY read error: {e}")
+                        logger.warning(f"Windows PTY read error: {e}")
+                    break
+
+                if data:
+                    # winpty may return string, convert to bytes if needed
+                    if isinstance(data, str):
+                        data = data.encode("utf-8", errors="replace")
+                    loop.call_soon_threadsafe(self._queue_output, data)
+                elif self._pty_process is None or not self._pty_process.isalive():
                     break
 
-        except asyncio.CancelledError:
-            pass
         finally:
             if self._is_active:
-                self._is_active = False
+                # Events must be toggled on the loop thread
+                loop.call_soon_threadsafe(self._mark_stopped)
                 logger.info(f"Terminal output stream ended for {self.project_name}")
-            # Reap zombie if not already reaped
-            if self._child_pid is not None:
-                try:
-                    os.waitpid(self._child_pid, os.WNOHANG)  # type: ignore[attr-defined]  # Unix-only method, guarded by runtime platform selection
-                except ChildProcessError:
-                    pass
-                except Exception:
-                    pass
 
-    def _check_child_alive(self) -> bool:
-        """Check if the Unix child process is still alive."""
-        if self._child_pid is None:
-            return False
+    def _on_pty_readable(self) -> None:
+        """Read available Unix PTY output from within the event loop.
+
+        Registered via loop.add_reader, so it runs on the loop thread with
+        no executor round-trip and no cross-thread handoff per chunk.
+        """
+        fd = self._master_fd
+        if fd is None:
+            return
+
+        # Drain the kernel buffer in one wakeup and broadcast a single
+        # combined chunk, capped so a firehose process can't starve the
+        # loop (epoll is level-triggered, so leftovers re-fire promptly)
+        parts: list[bytes] = []
+        total = 0
+        eof = False
+        while total < 1048576:
+            try:
+                data = os.read(fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                # EIO is the normal "child exited" signal on Linux PTYs
+                eof = True
+                break
+            if not data:
+                eof = True
+                break
+            parts.append(data)
+            total += len(data)
+
+        if parts:
+            self._queue_output(parts[0] if len(parts) == 1 else b"".join(parts))
+        if not eof:
+            return
+
+        # EOF - the shell exited on its own; deliver whatever is queued
+        self._flush_output()
+        self._disarm_writer()
+        self._write_buf.clear()
+        self._remove_reader()
         try:
-            # Use signal 0 to check if process exists without reaping it.
-            # This avoids race conditions with os.waitpid which can reap the process.
-            os.kill(self._child_pid, 0)
-            return True
+            os.close(fd)
         except OSError:
-            return False
+            pass
+        self._master_fd = None
+        if self._is_active:
+            self._mark_stopped()
+            logger.info(f"Terminal output stream ended for {self.project_name}")
+        # Reap zombie if not already reaped
+        if self._child_pid is not None:
+            try:
+                os.waitpid(self._child_pid, os.WNOHANG)  # type: ignore[attr-defined]  # Unix-only method, guarded by runtime platform selection
+            except ChildProcessError:
+                pass
+            except Exception:
+                pass
+
+    def _remove_reader(self) -> None:
+        """Unregister the PTY fd from the event loop (Unix only)."""
+        if self._loop is not None and self._master_fd is not None:
+            try:
+                self._loop.remove_reader(self._master_fd)
+            except (OSError, ValueError):
+                pass
 
     def write(self, data: bytes) -> None:
         """
@@ -396,6 +581,8 @@ class TerminalSession:
         Args:
             data: Raw bytes to write to the terminal
         """
+        if not data:
+            return
         if not self._is_active:
             logger.warning(f"Cannot write to inactive terminal for {self.project_name}")
             return
@@ -403,15 +590,137 @@ class TerminalSession:
         try:
             if IS_WINDOWS:
                 if self._pty_process is not None:
-                    # winpty expects string input
-                    text = data.decode("utf-8", errors="replace")
-                    self._pty_process.write(text)
+                    self._winpty_write(data)
             else:
                 if self._master_fd is not None:
-                    os.write(self._master_fd, data)
+                    self._write_buf += data
+                    self._flush_writes()
         except Exception as e:
             logger.warning(f"Failed to write to PTY: {e}")
 
+    def write_many(self, chunks: list[bytes]) -> None:
+        """
+        Write several input chunks to the PTY in one operation.
+
+        On Unix an unobstructed write is a single vectored ``os.writev``
+        syscall, so bulk pastes avoid both a join copy and per-chunk
+        syscalls; anything the kernel won't take yet is queued.
+
+        Args:
+            chunks: Raw byte chunks to write, in order
+        """
+        chunks = [c for c in chunks if c]
+        if not chunks:
+            return
+        if not self._is_active:
+            logger.warning(f"Cannot write to inactive terminal for {self.project_name}")
+            return
+
+        try:
+            if IS_WINDOWS:
+                if self._pty_process is not None:
+                    self._winpty_write(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+            else:
+                if self._master_fd is not None:
+                    self._writev_or_queue(chunks)
+        except Exception as e:
+            logger.warning(f"Failed to write to PTY: {e}")
+
+    def _writev_or_queue(self, chunks: list[bytes]) -> None:
+        """Gather-write chunks when nothing is queued, buffering any remainder."""
+        fd = self._master_fd
+        if fd is None:
+            return
+        if self._write_buf:
+            # Preserve ordering behind already-queued input
+            for chunk in chunks:
+                self._write_buf += chunk
+            self._flush_writes()
+            return
+
+        try:
+            written = os.writev(fd, chunks)
+        except BlockingIOError:
+            written = 0
+        except OSError as e:
+            logger.warning(f"Failed to write to PTY: {e}")
+            return
+        for chunk in chunks:
+            if written >= len(chunk):
+                written -= len(chunk)
+            else:
+                self._write_buf += chunk[written:] if written else chunk
+                written = 0
+        if self._write_buf:
+            self._arm_writer()
+
+    def _flush_writes(self) -> None:
+        """Push queued input into the PTY without ever blocking the loop.
+
+        Writes as much as the kernel accepts; if the PTY input buffer is
+        full (EAGAIN), the rest stays queued and ``loop.add_writer`` arms a
+        writability callback to resume. Also serves as that callback.
+        """
+        fd = self._master_fd
+        buf = self._write_buf
+        if fd is None:
+            buf.clear()
+            return
+        try:
+            while buf:
+                del buf[: os.write(fd, buf)]
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to write to PTY: {e}")
+            buf.clear()
+        if buf:
+            self._arm_writer()
+        else:
+            self._disarm_writer()
+
+    def _arm_writer(self) -> None:
+        """Register the writability callback for the master fd (idempotent)."""
+        if not self._write_waiting and self._loop is not None and self._master_fd is not None:
+            self._loop.add_writer(self._master_fd, self._flush_writes)
+            self._write_waiting = True
+
+    def _disarm_writer(self) -> None:
+        """Unregister the writability callback if armed."""
+        if self._write_waiting:
+            self._write_waiting = False
+            if self._loop is not None and self._master_fd is not None:
+                try:
+                    self._loop.remove_writer(self._master_fd)
+                except (OSError, ValueError):
+                    pass
+
+    def _winpty_write(self, data: bytes) -> None:
+        """Write to the winpty process, skipping the str round-trip when possible.
+
+        Newer pywinpty accepts bytes directly; older bindings raise
+        TypeError on bytes. The first write probes which form the API
+        accepts and later writes branch on the remembered answer instead
+        of paying an exception per call.
+        """
+        pty_process = self._pty_process
+        if pty_process is None:
+            return
+
+        if self._winpty_accepts_bytes is None:
+            try:
+                pty_process.write(data)
+                self._winpty_accepts_bytes = True
+            except TypeError:
+                self._winpty_accepts_bytes = False
+                pty_process.write(data.decode("utf-8", errors="replace"))
+            return
+
+        if self._winpty_accepts_bytes:
+            pty_process.write(data)
+        else:
+            pty_process.write(data.decode("utf-8", errors="replace"))
+
     def resize(self, cols: int, rows: int) -> None:
         """
         Resize the terminal.
@@ -442,16 +751,8 @@ class TerminalSession:
         if not self._is_active:
             return
 
-        self._is_active = False
-
-        # Cancel output reading task
-        if self._output_task is not None:
-            self._output_task.cancel()
-            try:
-                await self._output_task
-            except asyncio.CancelledError:
-                pass
-            self._output_task = None
+        self._flush_output()
+        self._mark_stopped()
 
         try:
             if IS_WINDOWS:
@@ -461,6 +762,13 @@ class TerminalSession:
         except Exception as e:
             logger.warning(f"Error stopping terminal: {e}")
 
+        # Closing the PTY unblocks the pump thread's read; reap it off-loop
+        if self._reader_thread is not None:
+            thread = self._reader_thread
+            self._reader_thread = None
+            if thread.is_alive():
+                await asyncio.to_thread(thread.join, 2.0)
+
         logger.info(f"Terminal stopped for {self.project_name}")
 
     async def _stop_windows(self) -> None:
@@ -484,6 +792,11 @@ class TerminalSession:
         """Stop Unix PTY process."""
         # Note: This method uses Unix-specific signal handling (signal imported at top-level)
 
+        # Unregister from the event loop before closing the fd
+        self._disarm_writer()
+        self._write_buf.clear()
+        self._remove_reader()
+
         # Close master file descriptor
         if self._master_fd is not None:
             try:
@@ -524,10 +837,21 @@ _sessions: dict[str, dict[str, TerminalSession]] = {}
 _sessions_lock = threading.Lock()
 
 # Terminal metadata registry (in-memory, resets on server restart)
-# Structure: Dict[project_name, List[TerminalInfo]]
-_terminal_metadata: dict[str, list[TerminalInfo]] = {}
+# Keyed by terminal_id per project so lookup/rename/delete are O(1);
+# insertion order doubles as creation order for listings
+# Structure: Dict[project_name, Dict[terminal_id, TerminalInfo]]
+_terminal_metadata: dict[str, dict[str, TerminalInfo]] = {}
 _metadata_lock = threading.Lock()
 
+# Monotonic per-project counter for auto-generated "Terminal N" names.
+# Never decremented on delete, so names are not reused within a server run.
+_terminal_counter: dict[str, int] = {}
+
+# Terminal ids only need to be unique within a server run (metadata resets
+# on restart), so a counter rendered as 8 hex digits replaces uuid4 —
+# no urandom call, no UUID object, and guaranteed collision-free.
+_terminal_id_counter = itertools.count(1)
+
 
 def create_terminal(project_name: str, name: str | None = None) -> TerminalInfo:
     """
@@ -541,27 +865,18 @@ def create_terminal(project_name: str, name: str | None = None) -> TerminalInfo:
         TerminalInfo for the new terminal
     """
     with _metadata_lock:
-        if project_name not in _terminal_metadata:
-            _terminal_metadata[project_name] = []
-
-        terminals = _terminal_metadata[project_name]
+        terminals = _terminal_metadata.setdefault(project_name, {})
 
-        # Auto-generate name if not provided
+        # Auto-generate name if not provided: O(1) counter bump instead of
+        # rescanning and parsing every existing terminal name
         if name is None:
-            existing_nums = []
-            for t in terminals:
-                if t.name.startswith("Terminal "):
-                    try:
-                        num = int(t.name.replace("Terminal ", ""))
-                        existing_nums.append(num)
-                    except ValueError:
-                        pass
-            next_num = max(existing_nums, default=0) + 1
+            next_num = _terminal_counter.get(project_name, 0) + 1
+            _terminal_counter[project_name] = next_num
             name = f"Terminal {next_num}"
 
-        terminal_id = str(uuid.uuid4())[:8]
+        terminal_id = f"{next(_terminal_id_counter):08x}"
         info = TerminalInfo(id=terminal_id, name=name)
-        terminals.append(info)
+        terminals[terminal_id] = info
 
         logger.info(f"Created terminal '{name}' (ID: {terminal_id}) for project {project_name}")
         return info
@@ -578,7 +893,8 @@ def list_terminals(project_name: str) -> list[TerminalInfo]:
         List of TerminalInfo for the project
     """
     with _metadata_lock:
-        return list(_terminal_metadata.get(project_name, []))
+        terminals = _terminal_metadata.get(project_name)
+        return list(terminals.values()) if terminals else []
 
 
 def rename_terminal(project_name: str, terminal_id: str, new_name: str) -> bool:
@@ -594,17 +910,17 @@ def rename_terminal(project_name: str, terminal_id: str, new_name: str) -> bool:
         True if renamed successfully, False if terminal not found
     """
     with _metadata_lock:
-        terminals = _terminal_metadata.get(project_name, [])
-        for terminal in terminals:
-            if terminal.id == terminal_id:
-                old_name = terminal.name
-                terminal.name = new_name
-                logger.info(
-                    f"Renamed terminal '{old_name}' to '{new_name}' "
-                    f"(ID: {terminal_id}) for project {project_name}"
-                )
-                return True
-        return False
+        terminal = _terminal_metadata.get(project_name, {}).get(terminal_id)
+        if terminal is None:
+            return False
+        old_name = terminal.name
+        terminal.name = new_name
+
+    logger.info(
+        f"Renamed terminal '{old_name}' to '{new_name}' "
+        f"(ID: {terminal_id}) for project {project_name}"
+    )
+    return True
 
 
 def delete_terminal(project_name: str, terminal_id: str) -> bool:
@@ -620,18 +936,15 @@ def delete_terminal(project_name: str, terminal_id: str) -> bool:
     """
     # Remove from metadata
     with _metadata_lock:
-        terminals = _terminal_metadata.get(project_name, [])
-        for i, terminal in enumerate(terminals):
-            if terminal.id == terminal_id:
-                terminals.pop(i)
-                logger.info(
-                    f"Deleted terminal '{terminal.name}' (ID: {terminal_id}) "
-                    f"for project {project_name}"
-                )
-                break
-        else:
+        terminal = _terminal_metadata.get(project_name, {}).pop(terminal_id, None)
+        if terminal is None:
             return False
 
+    logger.info(
+        f"Deleted terminal '{terminal.name}' (ID: {terminal_id}) "
+        f"for project {project_name}"
+    )
+
     # Remove session if exists (will be stopped async by caller)
     with _sessions_lock:
         project_sessions = _sessions.get(project_name, {})
@@ -704,11 +1017,7 @@ def get_terminal_info(project_name: str, terminal_id: str) -> TerminalInfo | Non
         TerminalInfo if found, None otherwise
     """
     with _metadata_lock:
-        terminals = _terminal_metadata.get(project_name, [])
-        for terminal in terminals:
-            if terminal.id == terminal_id:
-                return terminal
-        return None
+        return _terminal_metadata.get(project_name, {}).get(terminal_id)
 
 
 async def stop_terminal_session(project_name: str, terminal_id: str) -> bool:
@@ -740,17 +1049,20 @@ async def cleanup_all_terminals() -> None:
         for project_sessions in _sessions.values():
             all_sessions.extend(project_sessions.values())
 
-    for session in all_sessions:
-        try:
-            if session.is_active:
-                await session.stop()
-        except Exception as e:
-            logger.warning(f"Error stopping terminal for {session.project_name}: {e}")
+    # Stop concurrently: each stop waits out its graceful-shutdown grace
+    # period, so sequential awaits would scale shutdown time with terminal
+    # count
+    active = [s for s in all_sessions if s.is_active]
+    results = await asyncio.gather(*(s.stop() for s in active), return_exceptions=True)
+    for session, result in zip(active, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Error stopping terminal for {session.project_name}: {result}")
 
     with _sessions_lock:
         _sessions.clear()
 
     with _metadata_lock:
         _terminal_metadata.clear()
+        _terminal_counter.clear()
 
     logger.info("All terminal sessions cleaned up")
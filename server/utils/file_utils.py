@@ -0,0 +1,31 @@
+"""
+File Utilities
+==============
+
+Small filesystem helpers shared across services.
+"""
+
+import os
+from pathlib import Path
+
+
+def write_bytes_if_changed(path: Path, content: bytes) -> None:
+    """Write ``content`` to ``path`` only if the current content differs.
+
+    Skips the redundant write syscall when the file already holds the
+    desired bytes; when a write is needed it goes through a temp file +
+    os.replace so a concurrent reader never sees a torn file.
+
+    Args:
+        path: Destination file.
+        content: Exact bytes the file should contain.
+    """
+    try:
+        if path.read_bytes() == content:
+            return
+    except OSError:
+        pass
+
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    tmp_file.write_bytes(content)
+    os.replace(tmp_file, path)
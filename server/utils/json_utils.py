@@ -0,0 +1,33 @@
+"""
+JSON Utilities
+==============
+
+orjson-backed JSON helpers for WebSocket hot paths. orjson serializes and
+parses in C, which matters when streaming one message per token. Falls back
+to the stdlib json module when orjson is not installed (e.g. a venv created
+before it was added to requirements).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - exercised only on older venvs
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
@@ -6,6 +6,7 @@ Shared project path lookup used across all server routers and websocket handlers
 Consolidates the previously duplicated _get_project_path() function.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -17,6 +18,16 @@ if str(_root) not in sys.path:
     sys.path.insert(0, str(_root))
 
 from registry import get_project_path as _registry_get_project_path
+from registry import get_registry_path as _get_registry_path
+
+# Successful lookups are cached while the registry database is unchanged;
+# the registry query is a SQLite round-trip that otherwise runs on every
+# request and WebSocket handshake. Each lookup stats the registry file and
+# a changed mtime drops the whole cache, so edits made outside the server
+# (e.g. delete + re-register at a new path via the CLI) are picked up.
+# Misses are NOT cached, so newly registered projects appear immediately.
+_path_cache: dict[str, Path] = {}
+_cache_registry_mtime_ns: int = -1
 
 
 def get_project_path(project_name: str) -> Path | None:
@@ -29,4 +40,31 @@ def get_project_path(project_name: str) -> Path | None:
         The resolved ``Path`` to the project directory, or ``None`` if the
         project is not found in the registry.
     """
-    return _registry_get_project_path(project_name)
+    global _cache_registry_mtime_ns
+
+    try:
+        mtime_ns = os.stat(_get_registry_path()).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    if mtime_ns != _cache_registry_mtime_ns:
+        _path_cache.clear()
+        _cache_registry_mtime_ns = mtime_ns
+
+    path = _path_cache.get(project_name)
+    if path is None:
+        path = _registry_get_project_path(project_name)
+        if path is not None:
+            _path_cache[project_name] = path
+    return path
+
+
+def invalidate_project_path_cache(project_name: str | None = None) -> None:
+    """Drop cached path lookups after a project is created, renamed, or deleted.
+
+    Args:
+        project_name: Specific project to evict, or ``None`` to clear all.
+    """
+    if project_name is None:
+        _path_cache.clear()
+    else:
+        _path_cache.pop(project_name, None)
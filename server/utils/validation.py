@@ -11,12 +11,31 @@ Two variants are provided:
   suitable for REST endpoint handlers.
 """
 
-import re
+import string
+from functools import lru_cache
 
 from fastapi import HTTPException
 
-# Compiled once; reused by both variants.
-_PROJECT_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]{1,50}$')
+# Pattern string, exported for FastAPI Path(pattern=...) validators.
+PROJECT_NAME_PATTERN = r'^[a-zA-Z0-9_-]{1,50}$'
+
+# The full allowed alphabet. Validation deletes these bytes from the name
+# via bytes.translate (a single C loop); anything left over is invalid.
+_VALID_BYTES = (string.ascii_letters + string.digits + "_-").encode("ascii")
+
+
+@lru_cache(maxsize=1024)
+def _check_name(name: str) -> bool:
+    """Core validator shared by both public variants.
+
+    Project names form a tiny closed set but are checked on every request,
+    so results are memoized; a repeat check is a dict lookup.
+    """
+    try:
+        encoded = name.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    return 0 < len(encoded) <= 50 and not encoded.translate(None, _VALID_BYTES)
 
 
 def is_valid_project_name(name: str) -> bool:
@@ -28,12 +47,17 @@ def is_valid_project_name(name: str) -> bool:
     Use this in WebSocket handlers where you need to close the socket
     yourself rather than raise an HTTP error.
     """
-    return bool(_PROJECT_NAME_RE.match(name))
+    return _check_name(name)
 
 
+@lru_cache(maxsize=256)
 def validate_project_name(name: str) -> str:
     """Validate and return *name*, or raise ``HTTPException(400)``.
 
+    Successful validations are LRU-cached, so repeat requests for the same
+    project skip validation entirely. (Failures are not cached; lru_cache
+    does not memoize raised exceptions.)
+
     Suitable for REST endpoint handlers where FastAPI will convert the
     exception into an HTTP 400 response automatically.
 
@@ -46,7 +70,7 @@ def validate_project_name(name: str) -> str:
     Raises:
         HTTPException: If *name* is invalid.
     """
-    if not _PROJECT_NAME_RE.match(name):
+    if not _check_name(name):
         raise HTTPException(
             status_code=400,
             detail="Invalid project name. Use only letters, numbers, hyphens, and underscores (1-50 chars)."
@@ -209,6 +209,103 @@ def test_compute_scheduling_scores_empty():
         return False
 
 
+def test_compute_scheduling_scores_cache_invalidation():
+    """Test that memoized scores reflect priority/dependency changes."""
+    print("\nTesting compute_scheduling_scores cache invalidation:")
+
+    features = [
+        {"id": 1, "priority": 1, "dependencies": []},
+        {"id": 2, "priority": 2, "dependencies": [1]},
+    ]
+
+    baseline = compute_scheduling_scores(features)
+
+    passed = True
+
+    # Changing a priority must produce fresh scores, not a stale cache hit
+    features[1]["priority"] = 9
+    rescored = compute_scheduling_scores(features)
+    if rescored[2] != baseline[2]:
+        print("  PASS: Priority change produced new scores")
+    else:
+        print(f"  FAIL: Stale score after priority change: {rescored}")
+        passed = False
+
+    # Changing dependencies must also invalidate
+    features[1]["dependencies"] = []
+    rewired = compute_scheduling_scores(features)
+    if rewired[1] != rescored[1]:
+        print("  PASS: Dependency change produced new scores")
+    else:
+        print(f"  FAIL: Stale score after dependency change: {rewired}")
+        passed = False
+
+    # Same graph content in a different order must score identically
+    reordered = compute_scheduling_scores(list(reversed(features)))
+    if reordered == rewired:
+        print("  PASS: Scores independent of feature order")
+    else:
+        print(f"  FAIL: Order changed scores: {reordered} vs {rewired}")
+        passed = False
+
+    return passed
+
+
+def test_resolve_dependencies_no_deps_fast_path():
+    """Test the fast path when no feature has dependencies."""
+    print("\nTesting resolve_dependencies with no dependencies:")
+
+    features = [
+        {"id": 3, "priority": 2, "dependencies": []},
+        {"id": 1, "priority": 1, "dependencies": None},
+        {"id": 2, "priority": 1, "dependencies": []},
+    ]
+
+    result = resolve_dependencies(features)
+
+    ordered_ids = [f["id"] for f in result["ordered_features"]]
+
+    # Should come out in (priority, id) order with empty metadata
+    if ordered_ids != [1, 2, 3]:
+        print(f"  FAIL: Expected [1, 2, 3], got {ordered_ids}")
+        return False
+    if (
+        result["circular_dependencies"]
+        or result["blocked_features"]
+        or result["missing_dependencies"]
+    ):
+        print(f"  FAIL: Expected empty metadata, got {result}")
+        return False
+    print(f"  PASS: Ordered by (priority, id): {ordered_ids}")
+    return True
+
+
+def test_resolve_dependencies_duplicate_deps():
+    """Test that duplicate dependency IDs don't corrupt the ordering."""
+    print("\nTesting resolve_dependencies with duplicate dependencies:")
+
+    # Repeated dep_id used to inflate in_degree so feature 2 never drained
+    # out of Kahn's queue and was misreported as cyclic
+    features = [
+        {"id": 1, "priority": 1, "dependencies": []},
+        {"id": 2, "priority": 2, "dependencies": [1, 1, 1]},
+        {"id": 3, "priority": 3, "dependencies": [2]},
+    ]
+
+    result = resolve_dependencies(features)
+
+    ordered_ids = [f["id"] for f in result["ordered_features"]]
+
+    if result["circular_dependencies"]:
+        print(f"  FAIL: False cycle: {result['circular_dependencies']}")
+        return False
+    if ordered_ids == [1, 2, 3]:
+        print(f"  PASS: Duplicates deduped, order: {ordered_ids}")
+        return True
+    print(f"  FAIL: Expected [1, 2, 3], got {ordered_ids}")
+    return False
+
+
 def test_would_create_circular_dependency():
     """Test cycle detection for new dependencies."""
     print("\nTesting would_create_circular_dependency:")
@@ -393,6 +490,9 @@ def run_all_tests():
         test_compute_scheduling_scores_complex_cycle,
         test_compute_scheduling_scores_diamond,
         test_compute_scheduling_scores_empty,
+        test_compute_scheduling_scores_cache_invalidation,
+        test_resolve_dependencies_no_deps_fast_path,
+        test_resolve_dependencies_duplicate_deps,
         test_would_create_circular_dependency,
         test_resolve_dependencies_with_cycle,
         test_are_dependencies_satisfied,
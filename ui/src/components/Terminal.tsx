@@ -16,29 +16,24 @@ interface TerminalProps {
   isActive: boolean
 }
 
-// WebSocket message types for terminal I/O
-interface TerminalInputMessage {
-  type: 'input'
-  data: string // base64 encoded
-}
-
+// WebSocket message types for terminal I/O.
+// PTY output arrives as binary frames (0x01 prefix + raw bytes) and keyboard
+// input is sent as raw binary frames; JSON is only used for control messages.
 interface TerminalResizeMessage {
   type: 'resize'
   cols: number
   rows: number
 }
 
-interface TerminalOutputMessage {
-  type: 'output'
-  data: string // base64 encoded
-}
-
 interface TerminalExitMessage {
   type: 'exit'
   code: number
 }
 
-type TerminalServerMessage = TerminalOutputMessage | TerminalExitMessage
+type TerminalServerMessage = TerminalExitMessage
+
+// First byte of binary server frames identifying PTY output
+const OUTPUT_FRAME_PREFIX = 0x01
 
 // Clean terminal theme colors
 const TERMINAL_THEME = {
@@ -105,42 +100,10 @@ export function Terminal({ projectName, terminalId, isActive }: TerminalProps) {
   }, [isActive])
 
   /**
-   * Encode string to base64
-   */
-  const encodeBase64 = useCallback((str: string): string => {
-    // Handle Unicode by encoding to UTF-8 first
-    const encoder = new TextEncoder()
-    const bytes = encoder.encode(str)
-    let binary = ''
-    for (let i = 0; i < bytes.length; i++) {
-      binary += String.fromCharCode(bytes[i])
-    }
-    return btoa(binary)
-  }, [])
-
-  /**
-   * Decode base64 to string
-   */
-  const decodeBase64 = useCallback((base64: string): string => {
-    try {
-      const binary = atob(base64)
-      const bytes = new Uint8Array(binary.length)
-      for (let i = 0; i < binary.length; i++) {
-        bytes[i] = binary.charCodeAt(i)
-      }
-      const decoder = new TextDecoder()
-      return decoder.decode(bytes)
-    } catch {
-      console.error('Failed to decode base64 data')
-      return ''
-    }
-  }, [])
-
-  /**
-   * Send a message through the WebSocket
+   * Send a control message through the WebSocket as JSON
    */
   const sendMessage = useCallback(
-    (message: TerminalInputMessage | TerminalResizeMessage) => {
+    (message: TerminalResizeMessage) => {
       if (wsRef.current?.readyState === WebSocket.OPEN) {
         wsRef.current.send(JSON.stringify(message))
       }
@@ -148,6 +111,15 @@ export function Terminal({ projectName, terminalId, isActive }: TerminalProps) {
     []
   )
 
+  /**
+   * Send keyboard input as a raw binary frame (no base64/JSON overhead)
+   */
+  const sendInput = useCallback((data: string) => {
+    if (wsRef.current?.readyState === WebSocket.OPEN) {
+      wsRef.current.send(new TextEncoder().encode(data))
+    }
+  }, [])
+
   /**
    * Send resize message to server
    */
@@ -228,6 +200,7 @@ export function Terminal({ projectName, terminalId, isActive }: TerminalProps) {
 
     try {
       const ws = new WebSocket(wsUrl)
+      ws.binaryType = 'arraybuffer'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -245,17 +218,19 @@ export function Terminal({ projectName, terminalId, isActive }: TerminalProps) {
       }
 
       ws.onmessage = (event) => {
+        // Binary frames carry raw PTY output; write bytes straight to xterm
+        if (event.data instanceof ArrayBuffer) {
+          const bytes = new Uint8Array(event.data)
+          if (bytes.length > 1 && bytes[0] === OUTPUT_FRAME_PREFIX && terminalRef.current) {
+            terminalRef.current.write(bytes.subarray(1))
+          }
+          return
+        }
+
         try {
           const message: TerminalServerMessage = JSON.parse(event.data)
 
           switch (message.type) {
-            case 'output': {
-              const decoded = decodeBase64(message.data)
-              if (decoded && terminalRef.current) {
-                terminalRef.current.write(decoded)
-              }
-              break
-            }
             case 'exit': {
               setHasExited(true)
               setExitCode(message.code)
@@ -318,7 +293,7 @@ export function Terminal({ projectName, terminalId, isActive }: TerminalProps) {
         connect()
       }, delay)
     }
-  }, [projectName, terminalId, sendResize, decodeBase64])
+  }, [projectName, terminalId, sendResize])
 
   // Keep connect ref up to date
   useEffect(() => {
@@ -369,19 +344,15 @@ export function Terminal({ projectName, terminalId, isActive }: TerminalProps) {
         return
       }
 
-      // Send input to server
-      const message: TerminalInputMessage = {
-        type: 'input',
-        data: encodeBase64(data),
-      }
-      sendMessage(message)
+      // Send input to server as a raw binary frame
+      sendInput(data)
     })
 
     // Handle terminal resize
     terminal.onResize(({ cols, rows }: { cols: number; rows: number }) => {
       sendResize(cols, rows)
     })
-  }, [encodeBase64, sendMessage, sendResize])
+  }, [sendInput, sendResize])
 
   /**
    * Handle window resize